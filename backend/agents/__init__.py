@@ -3,23 +3,49 @@ AgentForge Studio - Agents Package.
 
 This package contains all AI agent implementations for the
 AgentForge Studio development agency.
+
+Agent classes are imported lazily on first attribute access, so importing
+one agent does not load every other agent module.
 """
 
-from backend.agents.accessibility_agent import AccessibilityAgent
-from backend.agents.analytics_agent import AnalyticsAgent
-from backend.agents.backend_agent import BackendAgent
-from backend.agents.base_agent import BaseAgent
-from backend.agents.designer_agent import DesignerAgent
-from backend.agents.error_handler import ErrorHandlerAgent
-from backend.agents.frontend_agent import FrontendAgent
-from backend.agents.helper import Helper
-from backend.agents.intermediator import Intermediator
-from backend.agents.optimizer_agent import OptimizerAgent
-from backend.agents.orchestrator import Orchestrator
-from backend.agents.planner import Planner
-from backend.agents.reviewer import Reviewer
-from backend.agents.security_agent import SecurityAgent
-from backend.agents.tester import Tester
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from backend.agents.accessibility_agent import AccessibilityAgent
+    from backend.agents.analytics_agent import AnalyticsAgent
+    from backend.agents.backend_agent import BackendAgent
+    from backend.agents.base_agent import BaseAgent
+    from backend.agents.designer_agent import DesignerAgent
+    from backend.agents.error_handler import ErrorHandlerAgent
+    from backend.agents.frontend_agent import FrontendAgent
+    from backend.agents.helper import Helper
+    from backend.agents.intermediator import Intermediator
+    from backend.agents.optimizer_agent import OptimizerAgent
+    from backend.agents.orchestrator import Orchestrator
+    from backend.agents.planner import Planner
+    from backend.agents.reviewer import Reviewer
+    from backend.agents.security_agent import SecurityAgent
+    from backend.agents.tester import Tester
+
+# Maps each exported class to the module that defines it
+_LAZY_IMPORTS = {
+    "AccessibilityAgent": "backend.agents.accessibility_agent",
+    "AnalyticsAgent": "backend.agents.analytics_agent",
+    "BackendAgent": "backend.agents.backend_agent",
+    "BaseAgent": "backend.agents.base_agent",
+    "DesignerAgent": "backend.agents.designer_agent",
+    "ErrorHandlerAgent": "backend.agents.error_handler",
+    "FrontendAgent": "backend.agents.frontend_agent",
+    "Helper": "backend.agents.helper",
+    "Intermediator": "backend.agents.intermediator",
+    "OptimizerAgent": "backend.agents.optimizer_agent",
+    "Orchestrator": "backend.agents.orchestrator",
+    "Planner": "backend.agents.planner",
+    "Reviewer": "backend.agents.reviewer",
+    "SecurityAgent": "backend.agents.security_agent",
+    "Tester": "backend.agents.tester",
+}
 
 __all__ = [
     "BaseAgent",
@@ -39,3 +65,19 @@ __all__ = [
     "AccessibilityAgent",
     "AnalyticsAgent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an agent class on first access and cache it on the package."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package attributes, including not-yet-imported agents."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,14 +5,128 @@ The Accessibility Agent performs WCAG compliance audits, adds ARIA labels,
 and checks color contrast for accessibility compliance.
 """
 
+import asyncio
+import atexit
+import hashlib
+import multiprocessing
 import re
-from datetime import datetime
+from bisect import bisect_right
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
 from backend.agents.base_agent import BaseAgent
 from backend.models.schemas import Message
 
+# Every tag the audit inspects, matched in a single sweep of the document.
+# Audits run on UTF-8 bytes; all the markup matched here is ASCII. The
+# outer named group identifies which check a match belongs to. The shared
+# "<" prefix and the first-letter lookahead let the engine reject
+# unrelated tags before trying any of the alternatives.
+_AUDIT_RE = re.compile(
+    rb"<(?=[abhilm])(?:"
+    rb"(?P<img>img[^>]*>)"
+    rb"|(?P<button>button[^>]*>\s*</button>)"
+    rb"|(?P<link>a[^>]*>\s*</a>)"
+    rb"|(?P<input>input\b[^>]*\bid=[\"'](?P<input_id>[^\"']+)[\"'][^>]*>)"
+    rb"|(?P<label>label[^>]*\bfor=[\"']?(?P<label_for>[^\"'>\s]+))"
+    rb"|(?P<html>html[^>]*>)"
+    rb"|(?P<heading>h(?P<heading_level>[1-6])[^>]*>)"
+    rb"|(?P<viewport>meta[^>]*name=[\"']?viewport[\"']?[^>]*>)"
+    rb")",
+    re.IGNORECASE,
+)
+
+# Regions whose contents are not rendered markup and must not be audited
+_NON_MARKUP_RE = re.compile(
+    rb"<!--.*?-->"
+    rb"|<!\[CDATA\[.*?\]\]>"
+    rb"|<script\b[^>]*>.*?</script\s*>"
+    rb"|<style\b[^>]*>.*?</style\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+# Maps every byte to a space except newlines, for masking regions
+_MASK_TABLE = bytes(b if b == ord("\n") else ord(" ") for b in range(256))
+
+# Substitution patterns used by add_aria_labels
+_IMG_NO_ALT_RE = re.compile(r"<img(?![^>]*alt=)([^>]*)>")
+_NAV_NO_ROLE_RE = re.compile(r"<nav(?![^>]*role=)([^>]*)>")
+_MAIN_NO_ROLE_RE = re.compile(r"<main(?![^>]*role=)([^>]*)>")
+
+
+# Linearized value of every 8-bit sRGB channel, for relative luminance
+_SRGB_LINEAR = tuple(
+    c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    for c in (value / 255 for value in range(256))
+)
+
+
+def _relative_luminance(r: int, g: int, b: int) -> float:
+    """Calculate the WCAG relative luminance of an 8-bit RGB color."""
+    return (
+        0.2126 * _SRGB_LINEAR[r]
+        + 0.7152 * _SRGB_LINEAR[g]
+        + 0.0722 * _SRGB_LINEAR[b]
+    )
+
+
+def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
+    """Convert hex color to RGB."""
+    hex_color = hex_color.lstrip("#")
+    return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+
+
+@lru_cache(maxsize=4096)
+def _hex_luminance(hex_color: str) -> float:
+    """Calculate the relative luminance of a hex color, memoized per color."""
+    return _relative_luminance(*_hex_to_rgb(hex_color))
+
+
+def _mask_non_markup(html: bytes) -> bytes:
+    """
+    Blank out comments, CDATA, scripts and styles in the HTML.
+
+    Masked bytes are replaced with spaces and newlines are kept, so match
+    positions and line numbers in the result still refer to the original
+    document.
+    """
+    return _NON_MARKUP_RE.sub(lambda match: match.group().translate(_MASK_TABLE), html)
+
+
+def _element_text(match: re.Match[bytes]) -> str:
+    """Decode a matched element for reporting, truncated to 100 characters."""
+    return match.group().decode("utf-8", "replace")[:100]
+
+
+class _LineIndex:
+    """
+    Resolve byte positions in a document to 1-based line numbers.
+
+    Newline positions are only collected when the first line number is
+    requested, so documents without issues are never indexed.
+    """
+
+    __slots__ = ("_html", "_offsets")
+
+    def __init__(self, html: bytes) -> None:
+        self._html = html
+        self._offsets: list[int] | None = None
+
+    def line_number(self, position: int) -> int:
+        """Return the line number containing the given position."""
+        if self._offsets is None:
+            offsets = []
+            pos = self._html.find(b"\n")
+            while pos != -1:
+                offsets.append(pos)
+                pos = self._html.find(b"\n", pos + 1)
+            self._offsets = offsets
+        return bisect_right(self._offsets, position) + 1
+
 
 class WCAGLevel(str, Enum):
     """WCAG compliance levels."""
@@ -22,44 +136,43 @@ class WCAGLevel(str, Enum):
     AAA = "AAA"
 
 
+class AccessibilitySeverity(str, Enum):
+    """Severity levels for accessibility issues."""
+
+    CRITICAL = "critical"
+    SERIOUS = "serious"
+    MODERATE = "moderate"
+    MINOR = "minor"
+
+
+@dataclass(slots=True, frozen=True)
 class AccessibilityIssue:
-    """Represents an accessibility issue."""
+    """
+    Represents an accessibility issue.
 
-    def __init__(
-        self,
-        rule: str,
-        severity: str,
-        description: str,
-        wcag_criterion: str | None = None,
-        element: str | None = None,
-        line_number: int | None = None,
-        recommendation: str | None = None,
-    ) -> None:
-        """
-        Initialize an accessibility issue.
+    Attributes:
+        rule: The accessibility rule violated.
+        severity: Severity level (critical, serious, moderate, minor).
+        description: Description of the issue.
+        wcag_criterion: WCAG success criterion reference.
+        element: The HTML element with the issue.
+        line_number: Optional line number.
+        recommendation: Optional fix recommendation.
+    """
 
-        Args:
-            rule: The accessibility rule violated.
-            severity: Severity level (critical, serious, moderate, minor).
-            description: Description of the issue.
-            wcag_criterion: WCAG success criterion reference.
-            element: The HTML element with the issue.
-            line_number: Optional line number.
-            recommendation: Optional fix recommendation.
-        """
-        self.rule = rule
-        self.severity = severity
-        self.description = description
-        self.wcag_criterion = wcag_criterion
-        self.element = element
-        self.line_number = line_number
-        self.recommendation = recommendation
+    rule: str
+    severity: AccessibilitySeverity
+    description: str
+    wcag_criterion: str | None = None
+    element: str | None = None
+    line_number: int | None = None
+    recommendation: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
         return {
             "rule": self.rule,
-            "severity": self.severity,
+            "severity": getattr(self.severity, "value", self.severity),
             "description": self.description,
             "wcag_criterion": self.wcag_criterion,
             "element": self.element,
@@ -68,6 +181,283 @@ class AccessibilityIssue:
         }
 
 
+# Process pool for CPU-bound audits, shared by every agent in this process.
+# It is started on first use and shut down at exit, so its workers never
+# outlive the server. Workers are spawned rather than forked: the server
+# already runs threads (the log queue listener, asyncio.to_thread workers),
+# and a forked child can inherit one of their locks while it is held.
+_audit_pool: ProcessPoolExecutor | None = None
+
+
+def _get_audit_pool() -> ProcessPoolExecutor:
+    """Return the shared audit process pool, starting it if needed."""
+    global _audit_pool
+    if _audit_pool is None:
+        _audit_pool = ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _audit_pool
+
+
+@atexit.register
+def shutdown_audit_pool() -> None:
+    """
+    Shut down the shared audit process pool, if one was started.
+
+    Waits for audits already submitted to the pool. The pool is started
+    again by the next process-based audit.
+    """
+    global _audit_pool
+    pool, _audit_pool = _audit_pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _run_audit_checks(html: bytes) -> list[AccessibilityIssue]:
+    """
+    Run every audit check against the HTML.
+
+    Args:
+        html: The UTF-8 encoded HTML to audit.
+
+    Returns:
+        list: Issues from all checks, in document order.
+    """
+    # Prepare the document once and share it across every check
+    html = _mask_non_markup(html)
+    line_index = _LineIndex(html)
+
+    issues: list[AccessibilityIssue] = []
+    inputs: list[re.Match[bytes]] = []
+    labelled_ids: set[bytes] = set()
+    prev_heading_level = 0
+    html_tag_seen = False
+    viewport_seen = False
+
+    for match in _AUDIT_RE.finditer(html):
+        kind = match.lastgroup
+        if kind == "img":
+            _check_img_alt(match, line_index, issues)
+        elif kind == "button":
+            _check_button_names(match, line_index, issues)
+        elif kind == "link":
+            _check_link_names(match, line_index, issues)
+        elif kind == "input":
+            inputs.append(match)
+        elif kind == "label":
+            labelled_ids.add(match.group("label_for"))
+        elif kind == "heading":
+            level = int(match.group("heading_level"))
+            _check_heading_order(prev_heading_level, level, match, line_index, issues)
+            prev_heading_level = level
+        elif kind == "html" and not html_tag_seen:
+            # Only the first <html> element is checked
+            html_tag_seen = True
+            _check_html_lang(match, line_index, issues)
+        elif kind == "viewport" and not viewport_seen:
+            # Only the first viewport meta tag is checked
+            viewport_seen = True
+            _check_viewport(match, line_index, issues)
+
+    # Labels may come after their inputs, so resolve them after the sweep
+    _check_form_labels(inputs, labelled_ids, line_index, issues)
+
+    return issues
+
+
+def _check_img_alt(
+    match: re.Match[bytes],
+    line_index: _LineIndex,
+    issues: list[AccessibilityIssue],
+) -> None:
+    """Check an image tag for a missing alt attribute."""
+    if b"alt=" in match.group().lower():
+        return
+
+    issues.append(
+        AccessibilityIssue(
+            rule="img-alt",
+            severity=AccessibilitySeverity.CRITICAL,
+            description="Image missing alt attribute",
+            wcag_criterion="1.1.1",
+            element=_element_text(match),
+            line_number=line_index.line_number(match.start()),
+            recommendation=(
+                "Add an alt attribute describing the image content. "
+                "Use alt='' for decorative images."
+            ),
+        )
+    )
+
+
+def _check_button_names(
+    match: re.Match[bytes],
+    line_index: _LineIndex,
+    issues: list[AccessibilityIssue],
+) -> None:
+    """Check an empty button for an accessible name."""
+    if b"aria-label" in match.group().lower():
+        return
+
+    issues.append(
+        AccessibilityIssue(
+            rule="button-name",
+            severity=AccessibilitySeverity.CRITICAL,
+            description="Button has no accessible name",
+            wcag_criterion="4.1.2",
+            element=_element_text(match),
+            line_number=line_index.line_number(match.start()),
+            recommendation=(
+                "Add visible text content or aria-label to the button."
+            ),
+        )
+    )
+
+
+def _check_link_names(
+    match: re.Match[bytes],
+    line_index: _LineIndex,
+    issues: list[AccessibilityIssue],
+) -> None:
+    """Check an empty link for an accessible name."""
+    if b"aria-label" in match.group().lower():
+        return
+
+    issues.append(
+        AccessibilityIssue(
+            rule="link-name",
+            severity=AccessibilitySeverity.CRITICAL,
+            description="Link has no accessible name",
+            wcag_criterion="2.4.4",
+            element=_element_text(match),
+            line_number=line_index.line_number(match.start()),
+            recommendation=(
+                "Add visible text content or aria-label to the link."
+            ),
+        )
+    )
+
+
+def _check_form_labels(
+    inputs: list[re.Match[bytes]],
+    labelled_ids: set[bytes],
+    line_index: _LineIndex,
+    issues: list[AccessibilityIssue],
+) -> None:
+    """Check form inputs against the ids targeted by labels."""
+    for input_match in inputs:
+        if input_match.group("input_id") in labelled_ids:
+            continue
+
+        # Also check for aria-label or aria-labelledby
+        if b"aria-label" not in input_match.group().lower():
+            input_id = input_match.group("input_id").decode("utf-8", "replace")
+            issues.append(
+                AccessibilityIssue(
+                    rule="form-label",
+                    severity=AccessibilitySeverity.CRITICAL,
+                    description=f"Input '{input_id}' missing label",
+                    wcag_criterion="1.3.1",
+                    element=_element_text(input_match),
+                    line_number=line_index.line_number(input_match.start()),
+                    recommendation=(
+                        "Add a <label for='id'> element or "
+                        "aria-label attribute."
+                    ),
+                )
+            )
+
+
+def _check_html_lang(
+    match: re.Match[bytes],
+    line_index: _LineIndex,
+    issues: list[AccessibilityIssue],
+) -> None:
+    """Check the html tag for a lang attribute."""
+    if b"lang=" in match.group().lower():
+        return
+
+    issues.append(
+        AccessibilityIssue(
+            rule="html-lang",
+            severity=AccessibilitySeverity.SERIOUS,
+            description="HTML element missing lang attribute",
+            wcag_criterion="3.1.1",
+            element=_element_text(match),
+            line_number=line_index.line_number(match.start()),
+            recommendation=(
+                "Add lang attribute to <html> element. "
+                "Example: <html lang='en'>"
+            ),
+        )
+    )
+
+
+def _check_heading_order(
+    prev_level: int,
+    level: int,
+    match: re.Match[bytes],
+    line_index: _LineIndex,
+    issues: list[AccessibilityIssue],
+) -> None:
+    """Check that a heading does not skip a level after the previous one."""
+    if prev_level == 0 or level <= prev_level + 1:
+        return
+
+    issues.append(
+        AccessibilityIssue(
+            rule="heading-order",
+            severity=AccessibilitySeverity.MODERATE,
+            description=f"Heading level skipped: h{prev_level} to h{level}",
+            wcag_criterion="1.3.1",
+            line_number=line_index.line_number(match.start()),
+            recommendation=(
+                f"Use h{prev_level + 1} instead of h{level} "
+                "to maintain proper heading hierarchy."
+            ),
+        )
+    )
+
+
+def _check_viewport(
+    match: re.Match[bytes],
+    line_index: _LineIndex,
+    issues: list[AccessibilityIssue],
+) -> None:
+    """Check the viewport meta tag for zoom restrictions."""
+    viewport_lower = match.group().lower()
+    line_number = line_index.line_number(match.start())
+
+    if b"user-scalable=no" in viewport_lower:
+        issues.append(
+            AccessibilityIssue(
+                rule="meta-viewport",
+                severity=AccessibilitySeverity.SERIOUS,
+                description="Viewport disables user zoom (user-scalable=no)",
+                wcag_criterion="1.4.4",
+                element=_element_text(match),
+                line_number=line_number,
+                recommendation=(
+                    "Remove user-scalable=no to allow users to zoom the page."
+                ),
+            )
+        )
+    if b"maximum-scale=1" in viewport_lower:
+        issues.append(
+            AccessibilityIssue(
+                rule="meta-viewport",
+                severity=AccessibilitySeverity.SERIOUS,
+                description="Viewport restricts zoom (maximum-scale=1)",
+                wcag_criterion="1.4.4",
+                element=_element_text(match),
+                line_number=line_number,
+                recommendation=(
+                    "Remove maximum-scale=1 to allow users to zoom the page."
+                ),
+            )
+        )
+
+
 class AccessibilityAgent(BaseAgent):
     """
     Accessibility Agent that checks WCAG compliance.
@@ -76,8 +466,8 @@ class AccessibilityAgent(BaseAgent):
     checks color contrast, and suggests accessibility improvements.
 
     Attributes:
-        issues: List of accessibility issues found.
-        audit_history: History of accessibility audits.
+        issues: Most recent accessibility issues found, bounded in size.
+        audit_history: History of recent accessibility audits.
 
     Example:
         >>> a11y = AccessibilityAgent()
@@ -89,45 +479,52 @@ class AccessibilityAgent(BaseAgent):
         "img-alt": {
             "description": "Images must have alt attributes",
             "wcag": "1.1.1",
-            "severity": "critical",
+            "severity": AccessibilitySeverity.CRITICAL,
         },
         "button-name": {
             "description": "Buttons must have accessible names",
             "wcag": "4.1.2",
-            "severity": "critical",
+            "severity": AccessibilitySeverity.CRITICAL,
         },
         "link-name": {
             "description": "Links must have accessible names",
             "wcag": "2.4.4",
-            "severity": "critical",
+            "severity": AccessibilitySeverity.CRITICAL,
         },
         "form-label": {
             "description": "Form inputs must have labels",
             "wcag": "1.3.1",
-            "severity": "critical",
+            "severity": AccessibilitySeverity.CRITICAL,
         },
         "heading-order": {
             "description": "Heading levels should not be skipped",
             "wcag": "1.3.1",
-            "severity": "moderate",
+            "severity": AccessibilitySeverity.MODERATE,
         },
         "html-lang": {
             "description": "HTML should have a lang attribute",
             "wcag": "3.1.1",
-            "severity": "serious",
+            "severity": AccessibilitySeverity.SERIOUS,
         },
         "meta-viewport": {
             "description": "Viewport should not disable zoom",
             "wcag": "1.4.4",
-            "severity": "serious",
+            "severity": AccessibilitySeverity.SERIOUS,
         },
     }
 
+    # Number of distinct documents whose audit results are kept for reuse
+    AUDIT_CACHE_SIZE = 256
+
+    # Number of audits kept in the audit history
+    AUDIT_HISTORY_SIZE = 100
+
     def __init__(
         self,
         name: str = "AccessibilityAgent",
         model: str = "gemini-pro",
         message_bus: Any | None = None,
+        issue_history_size: int = 1000,
     ) -> None:
         """
         Initialize the Accessibility agent.
@@ -136,10 +533,18 @@ class AccessibilityAgent(BaseAgent):
             name: The agent's name. Defaults to 'AccessibilityAgent'.
             model: The AI model to use. Defaults to 'gemini-pro'.
             message_bus: Reference to the message bus for communication.
+            issue_history_size: Maximum number of issues kept; the oldest
+                are discarded first. Defaults to 1000.
         """
         super().__init__(name=name, model=model, message_bus=message_bus)
-        self._issues: list[AccessibilityIssue] = []
-        self._audit_history: list[dict[str, Any]] = []
+        self._issues: deque[AccessibilityIssue] = deque(maxlen=issue_history_size)
+        self._severity_counts: Counter[AccessibilitySeverity] = Counter()
+        self._audit_history: deque[dict[str, Any]] = deque(
+            maxlen=self.AUDIT_HISTORY_SIZE
+        )
+        self._audit_cache: OrderedDict[bytes, tuple[AccessibilityIssue, ...]] = (
+            OrderedDict()
+        )
 
     async def process(self, message: Message) -> Message:
         """
@@ -151,14 +556,15 @@ class AccessibilityAgent(BaseAgent):
         Returns:
             Message: Response with accessibility findings.
         """
-        await self._set_busy(f"Accessibility check: {message.content[:50]}")
+        await self._set_busy("Accessibility check: %.50s", message.content)
 
         try:
             # Perform accessibility audit
             issues = await self.audit_html(message.content)
 
-            critical_count = sum(1 for i in issues if i.severity == "critical")
-            serious_count = sum(1 for i in issues if i.severity == "serious")
+            severity_counts = Counter(i.severity for i in issues)
+            critical_count = severity_counts[AccessibilitySeverity.CRITICAL]
+            serious_count = severity_counts[AccessibilitySeverity.SERIOUS]
 
             if issues:
                 response_content = (
@@ -182,7 +588,7 @@ class AccessibilityAgent(BaseAgent):
             to_agent=message.from_agent,
             content=response_content,
             message_type="response",
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
     async def send_message(
@@ -223,270 +629,172 @@ class AccessibilityAgent(BaseAgent):
 
     async def audit_html(
         self,
-        html: str,
+        html: str | bytes,
         level: WCAGLevel = WCAGLevel.AA,
     ) -> list[AccessibilityIssue]:
         """
         Perform a WCAG compliance audit on HTML.
 
         Args:
-            html: The HTML code to audit.
+            html: The HTML code to audit, as text or UTF-8 bytes.
             level: WCAG compliance level to check against.
 
         Returns:
             list: List of accessibility issues found.
         """
-        await self._set_busy(f"Auditing for WCAG {level.value}")
-
-        issues: list[AccessibilityIssue] = []
-
-        # Check for images without alt
-        issues.extend(self._check_img_alt(html))
-
-        # Check for buttons without accessible names
-        issues.extend(self._check_button_names(html))
-
-        # Check for links without accessible names
-        issues.extend(self._check_link_names(html))
-
-        # Check for form inputs without labels
-        issues.extend(self._check_form_labels(html))
+        # Nothing to check in an empty ping; keep it out of the history too
+        if not html or html.isspace():
+            return []
 
-        # Check for html lang attribute
-        issues.extend(self._check_html_lang(html))
+        await self._set_busy("Auditing for WCAG %s", level.value)
+        timestamp = datetime.now(timezone.utc).isoformat()
 
-        # Check for heading order
-        issues.extend(self._check_heading_order(html))
-
-        # Check for viewport meta tag issues
-        issues.extend(self._check_viewport(html))
+        issues = await self._audit_document(html)
 
         # Store issues and update history
-        self._issues.extend(issues)
+        self._record_issues(issues)
         self._audit_history.append({
             "level": level.value,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "issues_count": len(issues),
         })
 
         await self._set_idle()
         return issues
 
-    def _check_img_alt(self, html: str) -> list[AccessibilityIssue]:
-        """Check for images missing alt attributes."""
-        issues = []
-        lines = html.split("\n")
-
-        for line_num, line in enumerate(lines, 1):
-            # Find img tags
-            img_matches = re.finditer(r"<img[^>]*>", line, re.IGNORECASE)
-            for match in img_matches:
-                img_tag = match.group()
-                # Check if alt attribute exists
-                if "alt=" not in img_tag.lower():
-                    issues.append(
-                        AccessibilityIssue(
-                            rule="img-alt",
-                            severity="critical",
-                            description="Image missing alt attribute",
-                            wcag_criterion="1.1.1",
-                            element=img_tag[:100],
-                            line_number=line_num,
-                            recommendation=(
-                                "Add an alt attribute describing the image content. "
-                                "Use alt='' for decorative images."
-                            ),
-                        )
-                    )
+    async def audit_html_batch(
+        self,
+        htmls: list[str | bytes],
+        level: WCAGLevel = WCAGLevel.AA,
+        max_concurrency: int = 32,
+        use_processes: bool = False,
+    ) -> list[list[AccessibilityIssue]]:
+        """
+        Perform a WCAG compliance audit on several HTML documents.
 
-        return issues
+        The documents are audited concurrently in worker threads, with a
+        single status transition and history entry for the whole batch.
+        Large batches can instead be spread over a process pool, which
+        runs the CPU-bound checks in parallel across cores.
 
-    def _check_button_names(self, html: str) -> list[AccessibilityIssue]:
-        """Check for buttons without accessible names."""
-        issues = []
-        lines = html.split("\n")
+        Args:
+            htmls: The HTML documents to audit, as text or UTF-8 bytes.
+            level: WCAG compliance level to check against.
+            max_concurrency: Maximum number of documents audited at once.
+            use_processes: Audit in a process pool instead of threads.
+                The pool is shared by all agents, created on first use and
+                shut down at interpreter exit or by shutdown_audit_pool().
 
-        for line_num, line in enumerate(lines, 1):
-            # Find empty buttons
-            button_matches = re.finditer(
-                r"<button[^>]*>\s*</button>", line, re.IGNORECASE
-            )
-            for match in button_matches:
-                button_tag = match.group()
-                if "aria-label" not in button_tag.lower():
-                    issues.append(
-                        AccessibilityIssue(
-                            rule="button-name",
-                            severity="critical",
-                            description="Button has no accessible name",
-                            wcag_criterion="4.1.2",
-                            element=button_tag[:100],
-                            line_number=line_num,
-                            recommendation=(
-                                "Add visible text content or aria-label to the button."
-                            ),
-                        )
-                    )
+        Returns:
+            list: One list of issues per document, in input order.
+        """
+        await self._set_busy(
+            "Auditing %d documents for WCAG %s", len(htmls), level.value
+        )
 
-        return issues
+        # One timestamp for the whole batch, taken when it starts
+        timestamp = datetime.now(timezone.utc).isoformat()
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-    def _check_link_names(self, html: str) -> list[AccessibilityIssue]:
-        """Check for links without accessible names."""
-        issues = []
-        lines = html.split("\n")
-
-        for line_num, line in enumerate(lines, 1):
-            # Find empty links or links with only images
-            link_matches = re.finditer(r"<a[^>]*>\s*</a>", line, re.IGNORECASE)
-            for match in link_matches:
-                link_tag = match.group()
-                if "aria-label" not in link_tag.lower():
-                    issues.append(
-                        AccessibilityIssue(
-                            rule="link-name",
-                            severity="critical",
-                            description="Link has no accessible name",
-                            wcag_criterion="2.4.4",
-                            element=link_tag[:100],
-                            line_number=line_num,
-                            recommendation=(
-                                "Add visible text content or aria-label to the link."
-                            ),
-                        )
-                    )
+        async def audit_one(html: str | bytes) -> list[AccessibilityIssue]:
+            async with semaphore:
+                return await self._audit_document(html, use_processes)
 
-        return issues
+        try:
+            results = await asyncio.gather(*(audit_one(html) for html in htmls))
+        except Exception as e:
+            # A broken pool or an unpicklable result must not leave the
+            # agent stuck as busy
+            await self._set_error(str(e))
+            raise
 
-    def _check_form_labels(self, html: str) -> list[AccessibilityIssue]:
-        """Check for form inputs without labels."""
-        issues = []
-
-        # Find all input elements with IDs
-        inputs = re.findall(r'<input[^>]*id=["\']([^"\']+)["\'][^>]*>', html)
-
-        for input_id in inputs:
-            # Check if there's a corresponding label
-            label_pattern = f'<label[^>]*for=["\']?{re.escape(input_id)}["\']?'
-            if not re.search(label_pattern, html, re.IGNORECASE):
-                # Also check for aria-label or aria-labelledby
-                input_pattern = f'<input[^>]*id=["\']?{re.escape(input_id)}["\']?[^>]*>'
-                input_match = re.search(input_pattern, html)
-                if input_match:
-                    input_tag = input_match.group()
-                    if (
-                        "aria-label" not in input_tag.lower()
-                        and "aria-labelledby" not in input_tag.lower()
-                    ):
-                        issues.append(
-                            AccessibilityIssue(
-                                rule="form-label",
-                                severity="critical",
-                                description=f"Input '{input_id}' missing label",
-                                wcag_criterion="1.3.1",
-                                element=input_tag[:100],
-                                recommendation=(
-                                    "Add a <label for='id'> element or "
-                                    "aria-label attribute."
-                                ),
-                            )
-                        )
+        # Store issues and update history once for the whole batch
+        total_issues = 0
+        for issues in results:
+            self._record_issues(issues)
+            total_issues += len(issues)
+        self._audit_history.append({
+            "level": level.value,
+            "timestamp": timestamp,
+            "issues_count": total_issues,
+            "documents": len(htmls),
+        })
 
-        return issues
+        await self._set_idle()
+        return list(results)
 
-    def _check_html_lang(self, html: str) -> list[AccessibilityIssue]:
-        """Check for html lang attribute."""
-        issues = []
-
-        # Find html tag
-        html_match = re.search(r"<html[^>]*>", html, re.IGNORECASE)
-        if html_match:
-            html_tag = html_match.group()
-            if "lang=" not in html_tag.lower():
-                issues.append(
-                    AccessibilityIssue(
-                        rule="html-lang",
-                        severity="serious",
-                        description="HTML element missing lang attribute",
-                        wcag_criterion="3.1.1",
-                        element=html_tag[:100],
-                        recommendation=(
-                            "Add lang attribute to <html> element. "
-                            "Example: <html lang='en'>"
-                        ),
-                    )
-                )
+    async def _audit_document(
+        self,
+        html: str | bytes,
+        use_processes: bool = False,
+    ) -> list[AccessibilityIssue]:
+        """
+        Audit one document, reusing the result of an identical earlier audit.
 
-        return issues
+        Args:
+            html: The HTML code to audit, as text or UTF-8 bytes.
+            use_processes: Run the checks in the process pool.
+
+        Returns:
+            list: Issues found in the document.
+        """
+        # Blank documents have nothing to check, so skip hashing them
+        if not html or html.isspace():
+            return []
+
+        # Text is encoded once; the same buffer is hashed and scanned
+        if isinstance(html, str):
+            html = html.encode("utf-8", "surrogatepass")
+
+        key = hashlib.blake2b(html, digest_size=16).digest()
+        cached = self._audit_cache.get(key)
+        if cached is not None:
+            self._audit_cache.move_to_end(key)
+            return list(cached)
+
+        # The checks are CPU-bound; run them off the event loop so other
+        # agents on the message bus keep being served during large audits
+        if use_processes:
+            rows = await asyncio.get_running_loop().run_in_executor(
+                _get_audit_pool(), _audit_worker, html
+            )
+            issues = [AccessibilityIssue(*row) for row in rows]
+        else:
+            issues = await asyncio.to_thread(self._run_checks, html)
 
-    def _check_heading_order(self, html: str) -> list[AccessibilityIssue]:
-        """Check for proper heading order (h1-h6)."""
-        issues = []
-
-        # Find all heading tags
-        headings = re.findall(r"<h([1-6])[^>]*>", html, re.IGNORECASE)
-
-        if headings:
-            prev_level = 0
-            for heading_level in headings:
-                level = int(heading_level)
-                if prev_level > 0 and level > prev_level + 1:
-                    issues.append(
-                        AccessibilityIssue(
-                            rule="heading-order",
-                            severity="moderate",
-                            description=(
-                                f"Heading level skipped: h{prev_level} to h{level}"
-                            ),
-                            wcag_criterion="1.3.1",
-                            recommendation=(
-                                f"Use h{prev_level + 1} instead of h{level} "
-                                "to maintain proper heading hierarchy."
-                            ),
-                        )
-                    )
-                prev_level = level
+        self._audit_cache[key] = tuple(issues)
+        if len(self._audit_cache) > self.AUDIT_CACHE_SIZE:
+            self._audit_cache.popitem(last=False)
 
         return issues
 
-    def _check_viewport(self, html: str) -> list[AccessibilityIssue]:
-        """Check for viewport meta tag issues."""
-        issues = []
+    def _record_issues(self, issues: list[AccessibilityIssue]) -> None:
+        """Store audit issues and keep the severity counters in step."""
+        max_issues = self._issues.maxlen
+        if len(issues) >= max_issues:
+            self._issues.clear()
+            self._severity_counts.clear()
+            issues = issues[len(issues) - max_issues :]
+        else:
+            # Evict the oldest issues ourselves so their severities are
+            # removed from the counters
+            for _ in range(len(self._issues) + len(issues) - max_issues):
+                self._severity_counts[self._issues.popleft().severity] -= 1
 
-        # Find viewport meta tag
-        viewport_match = re.search(
-            r'<meta[^>]*name=["\']?viewport["\']?[^>]*>', html, re.IGNORECASE
-        )
+        self._issues.extend(issues)
+        self._severity_counts.update(i.severity for i in issues)
 
-        if viewport_match:
-            viewport_tag = viewport_match.group()
-            if "user-scalable=no" in viewport_tag.lower():
-                issues.append(
-                    AccessibilityIssue(
-                        rule="meta-viewport",
-                        severity="serious",
-                        description="Viewport disables user zoom (user-scalable=no)",
-                        wcag_criterion="1.4.4",
-                        element=viewport_tag[:100],
-                        recommendation=(
-                            "Remove user-scalable=no to allow users to zoom the page."
-                        ),
-                    )
-                )
-            if "maximum-scale=1" in viewport_tag.lower():
-                issues.append(
-                    AccessibilityIssue(
-                        rule="meta-viewport",
-                        severity="serious",
-                        description="Viewport restricts zoom (maximum-scale=1)",
-                        wcag_criterion="1.4.4",
-                        element=viewport_tag[:100],
-                        recommendation=(
-                            "Remove maximum-scale=1 to allow users to zoom the page."
-                        ),
-                    )
-                )
+    def _run_checks(self, html: bytes) -> list[AccessibilityIssue]:
+        """
+        Run every audit check against the HTML.
 
-        return issues
+        Args:
+            html: The UTF-8 encoded HTML to audit.
+
+        Returns:
+            list: Issues from all checks, in document order.
+        """
+        return _run_audit_checks(html)
 
     async def add_aria_labels(
         self,
@@ -506,25 +814,13 @@ class AccessibilityAgent(BaseAgent):
         enhanced = html
 
         # Add aria-label to images without alt
-        enhanced = re.sub(
-            r'<img(?![^>]*alt=)([^>]*)>',
-            r'<img alt="" aria-hidden="true"\1>',
-            enhanced,
-        )
+        enhanced = _IMG_NO_ALT_RE.sub(r'<img alt="" aria-hidden="true"\1>', enhanced)
 
         # Add role="navigation" to nav elements without role
-        enhanced = re.sub(
-            r'<nav(?![^>]*role=)([^>]*)>',
-            r'<nav role="navigation"\1>',
-            enhanced,
-        )
+        enhanced = _NAV_NO_ROLE_RE.sub(r'<nav role="navigation"\1>', enhanced)
 
         # Add role="main" to main elements without role
-        enhanced = re.sub(
-            r'<main(?![^>]*role=)([^>]*)>',
-            r'<main role="main"\1>',
-            enhanced,
-        )
+        enhanced = _MAIN_NO_ROLE_RE.sub(r'<main role="main"\1>', enhanced)
 
         await self._set_idle()
         return enhanced
@@ -545,33 +841,39 @@ class AccessibilityAgent(BaseAgent):
             dict: Contrast check results.
         """
         await self._set_busy("Checking color contrast")
+        result = self._contrast_for_pair(foreground, background)
+        await self._set_idle()
+        return result
 
-        def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-            """Convert hex color to RGB."""
-            hex_color = hex_color.lstrip("#")
-            return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
-
-        def luminance(r: int, g: int, b: int) -> float:
-            """Calculate relative luminance."""
+    async def check_color_contrast_batch(
+        self,
+        pairs: list[tuple[str, str]],
+    ) -> list[dict[str, Any]]:
+        """
+        Check the contrast ratio of several color pairs.
 
-            def adjust(c: int) -> float:
-                c = c / 255
-                return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+        Args:
+            pairs: (foreground, background) hex color pairs.
 
-            return 0.2126 * adjust(r) + 0.7152 * adjust(g) + 0.0722 * adjust(b)
+        Returns:
+            list: Contrast check results, one per pair in input order.
+        """
+        await self._set_busy("Checking color contrast for %d pairs", len(pairs))
+        results = [self._contrast_for_pair(fg, bg) for fg, bg in pairs]
+        await self._set_idle()
+        return results
 
+    def _contrast_for_pair(self, foreground: str, background: str) -> dict[str, Any]:
+        """Compute the contrast check result for one color pair."""
         try:
-            fg_rgb = hex_to_rgb(foreground)
-            bg_rgb = hex_to_rgb(background)
-
-            fg_lum = luminance(*fg_rgb)
-            bg_lum = luminance(*bg_rgb)
+            fg_lum = _hex_luminance(foreground)
+            bg_lum = _hex_luminance(background)
 
             lighter = max(fg_lum, bg_lum)
             darker = min(fg_lum, bg_lum)
             ratio = (lighter + 0.05) / (darker + 0.05)
 
-            result = {
+            return {
                 "foreground": foreground,
                 "background": background,
                 "ratio": round(ratio, 2),
@@ -583,30 +885,28 @@ class AccessibilityAgent(BaseAgent):
 
         except Exception as e:
             self.logger.error(f"Color contrast check failed: {e}")
-            result = {
+            return {
                 "error": str(e),
                 "foreground": foreground,
                 "background": background,
             }
 
-        await self._set_idle()
-        return result
-
     async def get_accessibility_report(self) -> dict[str, Any]:
         """Generate an accessibility report."""
-        critical = sum(1 for i in self._issues if i.severity == "critical")
-        serious = sum(1 for i in self._issues if i.severity == "serious")
-
         return {
             "total_audits": len(self._audit_history),
             "total_issues": len(self._issues),
             "by_severity": {
-                "critical": critical,
-                "serious": serious,
-                "moderate": sum(1 for i in self._issues if i.severity == "moderate"),
-                "minor": sum(1 for i in self._issues if i.severity == "minor"),
+                "critical": self._severity_counts[AccessibilitySeverity.CRITICAL],
+                "serious": self._severity_counts[AccessibilitySeverity.SERIOUS],
+                "moderate": self._severity_counts[AccessibilitySeverity.MODERATE],
+                "minor": self._severity_counts[AccessibilitySeverity.MINOR],
             },
-            "issues": [i.to_dict() for i in self._issues[-20:]],  # Last 20 issues
+            # Last 20 issues
+            "issues": [
+                self._issues[index].to_dict()
+                for index in range(-min(len(self._issues), 20), 0)
+            ],
         }
 
     async def get_issues(self) -> list[dict[str, Any]]:
@@ -616,4 +916,27 @@ class AccessibilityAgent(BaseAgent):
     def clear_issues(self) -> None:
         """Clear all accessibility issues."""
         self._issues.clear()
+        self._severity_counts.clear()
         self._audit_history.clear()
+        self._audit_cache.clear()
+
+
+def _audit_worker(html: bytes) -> list[tuple[Any, ...]]:
+    """
+    Run the audit checks in a worker process.
+
+    Issues are returned as plain field tuples, which are cheaper to pickle
+    than the dataclass instances; the parent rebuilds the issues.
+    """
+    return [
+        (
+            issue.rule,
+            issue.severity,
+            issue.description,
+            issue.wcag_criterion,
+            issue.element,
+            issue.line_number,
+            issue.recommendation,
+        )
+        for issue in _run_audit_checks(html)
+    ]
@@ -5,12 +5,296 @@ The Analytics Agent generates analytics code, SEO meta tags,
 and sitemap files for web projects.
 """
 
-from datetime import datetime
+import io
+import json
+import time
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from backend.agents.base_agent import BaseAgent
 from backend.models.schemas import Message
 
+# Shared stand-in for requests that carry no metadata
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+# GA4 loader script, filled in with the tracking ID on each call
+_GA_SCRIPT_TEMPLATE = """<!-- Google Analytics (GA4) -->
+<script async src="https://www.googletagmanager.com/gtag/js?id={tracking_id}"></script>
+<script>
+  window.dataLayer = window.dataLayer || [];
+  function gtag(){{dataLayer.push(arguments);}}
+  gtag('js', new Date());
+  gtag('config', '{tracking_id}');
+</script>"""
+
+# Enhanced ecommerce helpers appended to the GA4 script when requested
+_GA_ECOMMERCE_SCRIPT = """
+<script>
+  // Enhanced Ecommerce tracking helper functions
+  function trackProductView(product) {
+    gtag('event', 'view_item', {
+      currency: product.currency || 'USD',
+      value: product.price,
+      items: [{
+        item_id: product.id,
+        item_name: product.name,
+        price: product.price,
+        quantity: 1
+      }]
+    });
+  }
+
+  function trackAddToCart(product) {
+    gtag('event', 'add_to_cart', {
+      currency: product.currency || 'USD',
+      value: product.price,
+      items: [{
+        item_id: product.id,
+        item_name: product.name,
+        price: product.price,
+        quantity: product.quantity || 1
+      }]
+    });
+  }
+
+  function trackPurchase(transaction) {
+    gtag('event', 'purchase', {
+      transaction_id: transaction.id,
+      value: transaction.total,
+      currency: transaction.currency || 'USD',
+      items: transaction.items
+    });
+  }
+</script>"""
+
+# Text that opens and closes every XML sitemap
+_SITEMAP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+_SITEMAP_FOOTER = "</urlset>"
+
+# Lines that open every robots.txt
+_ROBOTS_TXT_HEADER = ("# robots.txt", "User-agent: *")
+
+# SEO meta tags for a page; the *_tag and *_section fields are optional
+_SEO_TAGS_TEMPLATE = (
+    "<title>{title}</title>\n"
+    '<meta name="description" content="{description}">'
+    "{keywords_tag}{author_tag}\n"
+    "\n"
+    "<!-- Open Graph / Facebook -->\n"
+    '<meta property="og:type" content="website">\n'
+    '<meta property="og:title" content="{title}">\n'
+    '<meta property="og:description" content="{description}">'
+    "{og_url_tag}{og_image_tag}{og_site_name_tag}\n"
+    "\n"
+    "<!-- Twitter -->\n"
+    '<meta name="twitter:card" content="summary_large_image">\n'
+    '<meta name="twitter:title" content="{title}">\n'
+    '<meta name="twitter:description" content="{description}">'
+    "{twitter_site_tag}{twitter_image_tag}{canonical_section}"
+)
+
+# JSON-LD documents for the known structured data types. Only the values
+# are serialized per call; the fixed layout matches json.dumps(indent=2).
+_ORGANIZATION_JSON_TEMPLATE = (
+    "{{\n"
+    '  "@context": "https://schema.org",\n'
+    '  "@type": "Organization",\n'
+    '  "name": {name},\n'
+    '  "url": {url},\n'
+    '  "logo": {logo},\n'
+    '  "description": {description}{same_as}\n'
+    "}}"
+)
+
+_PRODUCT_JSON_TEMPLATE = (
+    "{{\n"
+    '  "@context": "https://schema.org",\n'
+    '  "@type": "Product",\n'
+    '  "name": {name},\n'
+    '  "description": {description},\n'
+    '  "image": {image},\n'
+    '  "sku": {sku},\n'
+    '  "offers": {{\n'
+    '    "@type": "Offer",\n'
+    '    "price": {price},\n'
+    '    "priceCurrency": {currency},\n'
+    '    "availability": "https://schema.org/InStock"\n'
+    "  }}\n"
+    "}}"
+)
+
+_ARTICLE_JSON_TEMPLATE = (
+    "{{\n"
+    '  "@context": "https://schema.org",\n'
+    '  "@type": "Article",\n'
+    '  "headline": {headline},\n'
+    '  "description": {description},\n'
+    '  "image": {image},\n'
+    '  "author": {{\n'
+    '    "@type": "Person",\n'
+    '    "name": {author}\n'
+    "  }},\n"
+    '  "datePublished": {published_date},\n'
+    '  "dateModified": {modified_date}\n'
+    "}}"
+)
+
+_WEBSITE_JSON_TEMPLATE = (
+    "{{\n"
+    '  "@context": "https://schema.org",\n'
+    '  "@type": "WebSite",\n'
+    '  "name": {name},\n'
+    '  "url": {url},\n'
+    '  "potentialAction": {{\n'
+    '    "@type": "SearchAction",\n'
+    '    "target": {target},\n'
+    '    "query-input": "required name=search_term_string"\n'
+    "  }}\n"
+    "}}"
+)
+
+
+# Current UTC day number and its date string, refreshed when the day changes
+_today_cache: tuple[int, str] = (-1, "")
+
+
+def _today_utc() -> str:
+    """
+    Get today's UTC date, formatting it at most once per day.
+
+    Returns:
+        str: The date as YYYY-MM-DD.
+    """
+    global _today_cache
+    day = int(time.time() // 86400)
+    if day != _today_cache[0]:
+        _today_cache = (day, time.strftime("%Y-%m-%d", time.gmtime(day * 86400)))
+    return _today_cache[1]
+
+
+@lru_cache(maxsize=128)
+def _build_google_analytics(tracking_id: str, enable_ecommerce: bool) -> str:
+    """
+    Build the GA4 script for a tracking ID.
+
+    Args:
+        tracking_id: Google Analytics tracking ID.
+        enable_ecommerce: Whether to append the ecommerce helpers.
+
+    Returns:
+        str: Google Analytics script code.
+    """
+    ga_code = _GA_SCRIPT_TEMPLATE.format(tracking_id=tracking_id)
+    if enable_ecommerce:
+        ga_code += _GA_ECOMMERCE_SCRIPT
+    return ga_code
+
+
+@lru_cache(maxsize=128)
+def _build_robots_txt(base_url: str, disallow_paths: tuple[str, ...]) -> str:
+    """
+    Build a robots.txt file.
+
+    Args:
+        base_url: The base URL of the website.
+        disallow_paths: Paths to disallow; everything is allowed when empty.
+
+    Returns:
+        str: robots.txt content.
+    """
+    lines = [*_ROBOTS_TXT_HEADER]
+
+    if disallow_paths:
+        lines.extend([f"Disallow: {path}" for path in disallow_paths])
+    else:
+        lines.append("Allow: /")
+
+    lines.extend(("", f"Sitemap: {base_url.rstrip('/')}/sitemap.xml"))
+    return "\n".join(lines)
+
+
+def _json_value(value: Any, depth: int = 1) -> str:
+    """
+    Serialize a value as it appears nested in an indent=2 JSON document.
+
+    Args:
+        value: The value to serialize.
+        depth: Nesting depth of the value within the document.
+
+    Returns:
+        str: The serialized value.
+    """
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, indent=2).replace("\n", "\n" + "  " * depth)
+    # Scalars serialize the same with or without indent, so use the C encoder
+    return json.dumps(value)
+
+
+def _organization_json(data: dict[str, Any]) -> str:
+    """Render Organization structured data."""
+    social_profiles = data.get("social_profiles")
+    return _ORGANIZATION_JSON_TEMPLATE.format(
+        name=_json_value(data.get("name", "")),
+        url=_json_value(data.get("url", "")),
+        logo=_json_value(data.get("logo", "")),
+        description=_json_value(data.get("description", "")),
+        same_as=(
+            f',\n  "sameAs": {_json_value(social_profiles)}'
+            if social_profiles
+            else ""
+        ),
+    )
+
+
+def _product_json(data: dict[str, Any]) -> str:
+    """Render Product structured data."""
+    return _PRODUCT_JSON_TEMPLATE.format(
+        name=_json_value(data.get("name", "")),
+        description=_json_value(data.get("description", "")),
+        image=_json_value(data.get("image", "")),
+        sku=_json_value(data.get("sku", "")),
+        price=_json_value(data.get("price", 0), 2),
+        currency=_json_value(data.get("currency", "USD"), 2),
+    )
+
+
+def _article_json(data: dict[str, Any]) -> str:
+    """Render Article structured data."""
+    return _ARTICLE_JSON_TEMPLATE.format(
+        headline=_json_value(data.get("headline", "")),
+        description=_json_value(data.get("description", "")),
+        image=_json_value(data.get("image", "")),
+        author=_json_value(data.get("author", ""), 2),
+        published_date=_json_value(data.get("published_date", "")),
+        modified_date=_json_value(data.get("modified_date", "")),
+    )
+
+
+def _website_json(data: dict[str, Any]) -> str:
+    """Render WebSite structured data."""
+    return _WEBSITE_JSON_TEMPLATE.format(
+        name=_json_value(data.get("name", "")),
+        url=_json_value(data.get("url", "")),
+        target=_json_value(
+            data.get("search_url", "{url}?q={search_term_string}"), 2
+        ),
+    )
+
+
+# Renderers for structured data types with a fixed layout
+_STRUCTURED_DATA_RENDERERS = {
+    "Organization": _organization_json,
+    "Product": _product_json,
+    "Article": _article_json,
+    "WebSite": _website_json,
+}
+
 
 class AnalyticsAgent(BaseAgent):
     """
@@ -28,6 +312,16 @@ class AnalyticsAgent(BaseAgent):
         >>> tracking_code = await analytics.generate_google_analytics("GA-XXXXX")
     """
 
+    # Request keywords mapped to handler method names, in priority order;
+    # subclasses can extend this to route new request types
+    _REQUEST_HANDLERS: dict[str, str] = {
+        "analytics": "_handle_analytics_request",
+        "tracking": "_handle_analytics_request",
+        "seo": "_handle_seo_request",
+        "meta": "_handle_seo_request",
+        "sitemap": "_handle_sitemap_request",
+    }
+
     def __init__(
         self,
         name: str = "AnalyticsAgent",
@@ -56,37 +350,19 @@ class AnalyticsAgent(BaseAgent):
         Returns:
             Message: Response with generated content.
         """
-        await self._set_busy(f"Processing: {message.content[:50]}")
+        await self._set_busy("Processing: %.50s", message.content)
 
         try:
             content_lower = message.content.lower()
-
-            if "analytics" in content_lower or "tracking" in content_lower:
-                tracking_id = (
-                    message.metadata.get("tracking_id", "GA-XXXXXXX")
-                    if message.metadata
-                    else "GA-XXXXXXX"
-                )
-                code = await self.generate_google_analytics(tracking_id)
-                response_content = f"Analytics code generated ({len(code)} chars)"
-            elif "seo" in content_lower or "meta" in content_lower:
-                page_info = message.metadata if message.metadata else {}
-                tags = await self.generate_seo_tags(page_info)
-                response_content = f"SEO tags generated ({len(tags)} chars)"
-            elif "sitemap" in content_lower:
-                pages = (
-                    message.metadata.get("pages", []) if message.metadata else []
-                )
-                sitemap = await self.generate_sitemap(
-                    "https://example.com", pages
-                )
-                response_content = f"Sitemap generated ({len(sitemap)} chars)"
-            else:
-                # General analytics request
-                response = await self.get_ai_response(
-                    f"Help with this analytics/SEO request: {message.content}"
-                )
-                response_content = response
+            handler_name = next(
+                (
+                    name
+                    for keyword, name in self._REQUEST_HANDLERS.items()
+                    if keyword in content_lower
+                ),
+                "_handle_general_request",
+            )
+            response_content = await getattr(self, handler_name)(message)
 
         except Exception as e:
             self.logger.error(f"Analytics task failed: {e}")
@@ -100,7 +376,63 @@ class AnalyticsAgent(BaseAgent):
             to_agent=message.from_agent,
             content=response_content,
             message_type="response",
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
+        )
+
+    async def _handle_analytics_request(self, message: Message) -> str:
+        """
+        Generate tracking code for an analytics request.
+
+        Args:
+            message: The incoming request message.
+
+        Returns:
+            str: Summary of the generated code.
+        """
+        metadata = message.metadata or _EMPTY_METADATA
+        tracking_id = metadata.get("tracking_id", "GA-XXXXXXX")
+        code = await self.generate_google_analytics(tracking_id)
+        return f"Analytics code generated ({len(code)} chars)"
+
+    async def _handle_seo_request(self, message: Message) -> str:
+        """
+        Generate SEO tags for an SEO request.
+
+        Args:
+            message: The incoming request message.
+
+        Returns:
+            str: Summary of the generated tags.
+        """
+        tags = self.generate_seo_tags(message.metadata or _EMPTY_METADATA)
+        return f"SEO tags generated ({len(tags)} chars)"
+
+    async def _handle_sitemap_request(self, message: Message) -> str:
+        """
+        Generate a sitemap for a sitemap request.
+
+        Args:
+            message: The incoming request message.
+
+        Returns:
+            str: Summary of the generated sitemap.
+        """
+        pages = (message.metadata or _EMPTY_METADATA).get("pages", [])
+        sitemap = self.generate_sitemap("https://example.com", pages)
+        return f"Sitemap generated ({len(sitemap)} chars)"
+
+    async def _handle_general_request(self, message: Message) -> str:
+        """
+        Ask the AI model for help with any other request.
+
+        Args:
+            message: The incoming request message.
+
+        Returns:
+            str: The AI response.
+        """
+        return await self.get_ai_response(
+            f"Help with this analytics/SEO request: {message.content}"
         )
 
     async def send_message(
@@ -156,64 +488,15 @@ class AnalyticsAgent(BaseAgent):
         """
         await self._set_busy("Generating Google Analytics code")
 
-        # GA4 script
-        ga_code = f"""<!-- Google Analytics (GA4) -->
-<script async src="https://www.googletagmanager.com/gtag/js?id={tracking_id}"></script>
-<script>
-  window.dataLayer = window.dataLayer || [];
-  function gtag(){{dataLayer.push(arguments);}}
-  gtag('js', new Date());
-  gtag('config', '{tracking_id}');
-</script>"""
-
-        if enable_ecommerce:
-            ga_code += """
-<script>
-  // Enhanced Ecommerce tracking helper functions
-  function trackProductView(product) {
-    gtag('event', 'view_item', {
-      currency: product.currency || 'USD',
-      value: product.price,
-      items: [{
-        item_id: product.id,
-        item_name: product.name,
-        price: product.price,
-        quantity: 1
-      }]
-    });
-  }
-
-  function trackAddToCart(product) {
-    gtag('event', 'add_to_cart', {
-      currency: product.currency || 'USD',
-      value: product.price,
-      items: [{
-        item_id: product.id,
-        item_name: product.name,
-        price: product.price,
-        quantity: product.quantity || 1
-      }]
-    });
-  }
-
-  function trackPurchase(transaction) {
-    gtag('event', 'purchase', {
-      transaction_id: transaction.id,
-      value: transaction.total,
-      currency: transaction.currency || 'USD',
-      items: transaction.items
-    });
-  }
-</script>"""
-
+        ga_code = _build_google_analytics(tracking_id, enable_ecommerce)
         self._generated_code["google_analytics"] = ga_code
 
         await self._set_idle()
         return ga_code
 
-    async def generate_seo_tags(
+    def generate_seo_tags(
         self,
-        page_info: dict[str, Any],
+        page_info: Mapping[str, Any],
     ) -> str:
         """
         Generate SEO meta tags for a page.
@@ -224,8 +507,6 @@ class AnalyticsAgent(BaseAgent):
         Returns:
             str: HTML meta tags for SEO.
         """
-        await self._set_busy("Generating SEO tags")
-
         title = page_info.get("title", "Page Title")
         description = page_info.get("description", "Page description")
         keywords = page_info.get("keywords", [])
@@ -235,61 +516,64 @@ class AnalyticsAgent(BaseAgent):
         author = page_info.get("author", "")
         twitter_handle = page_info.get("twitter_handle", "")
 
-        tags = []
-
-        # Basic meta tags
-        tags.append(f'<title>{title}</title>')
-        tags.append(f'<meta name="description" content="{description}">')
-
-        if keywords:
-            if isinstance(keywords, list):
-                keyword_str = ", ".join(keywords)
-            else:
-                keyword_str = keywords
-            tags.append(f'<meta name="keywords" content="{keyword_str}">')
-
-        if author:
-            tags.append(f'<meta name="author" content="{author}">')
-
-        # Open Graph tags
-        tags.append("")
-        tags.append("<!-- Open Graph / Facebook -->")
-        tags.append('<meta property="og:type" content="website">')
-        tags.append(f'<meta property="og:title" content="{title}">')
-        tags.append(f'<meta property="og:description" content="{description}">')
-
-        if url:
-            tags.append(f'<meta property="og:url" content="{url}">')
-        if image:
-            tags.append(f'<meta property="og:image" content="{image}">')
-        if site_name:
-            tags.append(f'<meta property="og:site_name" content="{site_name}">')
-
-        # Twitter Card tags
-        tags.append("")
-        tags.append("<!-- Twitter -->")
-        tags.append('<meta name="twitter:card" content="summary_large_image">')
-        tags.append(f'<meta name="twitter:title" content="{title}">')
-        tags.append(f'<meta name="twitter:description" content="{description}">')
-
-        if twitter_handle:
-            tags.append(f'<meta name="twitter:site" content="{twitter_handle}">')
-        if image:
-            tags.append(f'<meta name="twitter:image" content="{image}">')
-
-        # Canonical URL
-        if url:
-            tags.append("")
-            tags.append("<!-- Canonical -->")
-            tags.append(f'<link rel="canonical" href="{url}">')
-
-        seo_output = "\n".join(tags)
+        # Keywords may be a ready-made string or any iterable of strings
+        if keywords and not isinstance(keywords, str):
+            keywords = ", ".join(keywords)
+
+        # Optional tags start with their own newline and are empty when unset
+        seo_output = _SEO_TAGS_TEMPLATE.format(
+            title=title,
+            description=description,
+            keywords_tag=(
+                f'\n<meta name="keywords" content="{keywords}">' if keywords else ""
+            ),
+            author_tag=f'\n<meta name="author" content="{author}">' if author else "",
+            og_url_tag=f'\n<meta property="og:url" content="{url}">' if url else "",
+            og_image_tag=(
+                f'\n<meta property="og:image" content="{image}">' if image else ""
+            ),
+            og_site_name_tag=(
+                f'\n<meta property="og:site_name" content="{site_name}">'
+                if site_name
+                else ""
+            ),
+            twitter_site_tag=(
+                f'\n<meta name="twitter:site" content="{twitter_handle}">'
+                if twitter_handle
+                else ""
+            ),
+            twitter_image_tag=(
+                f'\n<meta name="twitter:image" content="{image}">' if image else ""
+            ),
+            canonical_section=(
+                f'\n\n<!-- Canonical -->\n<link rel="canonical" href="{url}">'
+                if url
+                else ""
+            ),
+        )
         self._seo_tags[url or "default"] = seo_output
 
-        await self._set_idle()
         return seo_output
 
-    async def generate_sitemap(
+    def generate_seo_tags_bytes(
+        self,
+        page_info: Mapping[str, Any],
+    ) -> bytes:
+        """
+        Generate SEO meta tags as UTF-8 bytes.
+
+        Route handlers can pass the result straight to a Response without
+        encoding it again.
+
+        Args:
+            page_info: Dictionary with page information.
+
+        Returns:
+            bytes: UTF-8 encoded HTML meta tags for SEO.
+        """
+        return self.generate_seo_tags(page_info).encode("utf-8")
+
+    def generate_sitemap(
         self,
         base_url: str,
         pages: list[dict[str, Any]] | None = None,
@@ -304,8 +588,6 @@ class AnalyticsAgent(BaseAgent):
         Returns:
             str: XML sitemap content.
         """
-        await self._set_busy("Generating sitemap")
-
         # Default pages if none provided
         if not pages:
             pages = [
@@ -314,40 +596,39 @@ class AnalyticsAgent(BaseAgent):
                 {"path": "/contact", "priority": "0.8", "changefreq": "monthly"},
             ]
 
-        sitemap_lines = [
-            '<?xml version="1.0" encoding="UTF-8"?>',
-            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
-        ]
+        today = _today_utc()
 
-        today = datetime.utcnow().strftime("%Y-%m-%d")
+        # Entries are streamed into one buffer, so large sitemaps don't keep
+        # a string per page alive until a final join
+        buffer = io.StringIO()
+        write = buffer.write
+        write(_SITEMAP_HEADER)
 
+        # Ensure base_url doesn't end with / and each path starts with /
+        clean_base = base_url.rstrip("/")
         for page in pages:
-            path = page.get("path", "/")
-            priority = page.get("priority", "0.5")
-            changefreq = page.get("changefreq", "monthly")
-            lastmod = page.get("lastmod", today)
-
-            # Ensure base_url doesn't end with / and path starts with /
-            clean_base = base_url.rstrip("/")
-            clean_path = path if path.startswith("/") else f"/{path}"
-            full_url = f"{clean_base}{clean_path}"
-
-            sitemap_lines.append("  <url>")
-            sitemap_lines.append(f"    <loc>{full_url}</loc>")
-            sitemap_lines.append(f"    <lastmod>{lastmod}</lastmod>")
-            sitemap_lines.append(f"    <changefreq>{changefreq}</changefreq>")
-            sitemap_lines.append(f"    <priority>{priority}</priority>")
-            sitemap_lines.append("  </url>")
-
-        sitemap_lines.append("</urlset>")
-
-        sitemap = "\n".join(sitemap_lines)
+            get = page.get
+            path = get("path", "/")
+            if not path.startswith("/"):
+                path = f"/{path}"
+            # Inline f-strings compile to direct concatenation, several times
+            # faster per entry than str.format with keyword arguments
+            write(
+                f"  <url>\n"
+                f"    <loc>{clean_base}{path}</loc>\n"
+                f"    <lastmod>{get('lastmod', today)}</lastmod>\n"
+                f"    <changefreq>{get('changefreq', 'monthly')}</changefreq>\n"
+                f"    <priority>{get('priority', '0.5')}</priority>\n"
+                f"  </url>\n"
+            )
+
+        write(_SITEMAP_FOOTER)
+        sitemap = buffer.getvalue()
         self._generated_code["sitemap"] = sitemap
 
-        await self._set_idle()
         return sitemap
 
-    async def generate_robots_txt(
+    def generate_robots_txt(
         self,
         base_url: str,
         disallow_paths: list[str] | None = None,
@@ -362,29 +643,12 @@ class AnalyticsAgent(BaseAgent):
         Returns:
             str: robots.txt content.
         """
-        await self._set_busy("Generating robots.txt")
-
-        lines = [
-            "# robots.txt",
-            "User-agent: *",
-        ]
-
-        if disallow_paths:
-            for path in disallow_paths:
-                lines.append(f"Disallow: {path}")
-        else:
-            lines.append("Allow: /")
-
-        lines.append("")
-        lines.append(f"Sitemap: {base_url.rstrip('/')}/sitemap.xml")
-
-        robots_txt = "\n".join(lines)
+        robots_txt = _build_robots_txt(base_url, tuple(disallow_paths or ()))
         self._generated_code["robots_txt"] = robots_txt
 
-        await self._set_idle()
         return robots_txt
 
-    async def generate_structured_data(
+    def generate_structured_data(
         self,
         data_type: str,
         data: dict[str, Any],
@@ -399,75 +663,24 @@ class AnalyticsAgent(BaseAgent):
         Returns:
             str: JSON-LD script tag.
         """
-        await self._set_busy(f"Generating {data_type} structured data")
-
-        import json
-
-        schema = {
-            "@context": "https://schema.org",
-            "@type": data_type,
-        }
-
-        # Add data based on type
-        if data_type == "Organization":
-            schema.update({
-                "name": data.get("name", ""),
-                "url": data.get("url", ""),
-                "logo": data.get("logo", ""),
-                "description": data.get("description", ""),
-            })
-            if data.get("social_profiles"):
-                schema["sameAs"] = data["social_profiles"]
-
-        elif data_type == "Product":
-            schema.update({
-                "name": data.get("name", ""),
-                "description": data.get("description", ""),
-                "image": data.get("image", ""),
-                "sku": data.get("sku", ""),
-                "offers": {
-                    "@type": "Offer",
-                    "price": data.get("price", 0),
-                    "priceCurrency": data.get("currency", "USD"),
-                    "availability": "https://schema.org/InStock",
-                },
-            })
-
-        elif data_type == "Article":
-            schema.update({
-                "headline": data.get("headline", ""),
-                "description": data.get("description", ""),
-                "image": data.get("image", ""),
-                "author": {
-                    "@type": "Person",
-                    "name": data.get("author", ""),
-                },
-                "datePublished": data.get("published_date", ""),
-                "dateModified": data.get("modified_date", ""),
-            })
-
-        elif data_type == "WebSite":
-            schema.update({
-                "name": data.get("name", ""),
-                "url": data.get("url", ""),
-                "potentialAction": {
-                    "@type": "SearchAction",
-                    "target": data.get("search_url", "{url}?q={search_term_string}"),
-                    "query-input": "required name=search_term_string",
-                },
-            })
-
+        renderer = _STRUCTURED_DATA_RENDERERS.get(data_type)
+        if renderer is not None:
+            schema_json = renderer(data)
         else:
             # Generic: add all data
+            schema = {
+                "@context": "https://schema.org",
+                "@type": data_type,
+            }
             schema.update(data)
+            schema_json = json.dumps(schema, indent=2)
 
         json_ld = f"""<script type="application/ld+json">
-{json.dumps(schema, indent=2)}
+{schema_json}
 </script>"""
 
         self._generated_code[f"structured_data_{data_type.lower()}"] = json_ld
 
-        await self._set_idle()
         return json_ld
 
     async def generate_analytics_dashboard_config(
@@ -531,13 +744,13 @@ class AnalyticsAgent(BaseAgent):
         await self._set_idle()
         return config
 
-    async def get_generated_code(self) -> dict[str, str]:
-        """Get all generated analytics code."""
-        return self._generated_code.copy()
+    async def get_generated_code(self) -> Mapping[str, str]:
+        """Get a read-only view of all generated analytics code."""
+        return MappingProxyType(self._generated_code)
 
-    async def get_seo_tags(self) -> dict[str, str]:
-        """Get all generated SEO tags."""
-        return self._seo_tags.copy()
+    async def get_seo_tags(self) -> Mapping[str, str]:
+        """Get a read-only view of all generated SEO tags."""
+        return MappingProxyType(self._seo_tags)
 
     def clear_generated(self) -> None:
         """Clear all generated content."""
@@ -5,7 +5,7 @@ The Backend Agent is responsible for creating server-side components
 including APIs, database schemas, and server-side logic.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
 from backend.agents.base_agent import BaseAgent
@@ -59,7 +59,7 @@ class BackendAgent(BaseAgent):
         Returns:
             Message: Response with development status.
         """
-        await self._set_busy(f"Building backend: {message.content[:50]}")
+        await self._set_busy("Building backend: %.50s", message.content)
 
         # TODO: Implement AI-powered backend generation
         # 1. Parse requirements
@@ -80,7 +80,7 @@ class BackendAgent(BaseAgent):
             to_agent=message.from_agent,
             content=response_content,
             message_type="response",
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
     async def send_message(
@@ -109,7 +109,7 @@ class BackendAgent(BaseAgent):
             to_agent=to_agent,
             content=content,
             message_type=message_type,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
         await self._log_activity("Sending message", f"To: {to_agent}")
@@ -146,7 +146,7 @@ class BackendAgent(BaseAgent):
         Returns:
             str: Generated endpoint code.
         """
-        await self._set_busy(f"Generating API endpoint: {name}")
+        await self._set_busy("Generating API endpoint: %s", name)
 
         # TODO: Implement AI-powered API generation
         endpoint_code = f'''
@@ -184,7 +184,7 @@ async def {name}():
         Returns:
             str: Generated schema code.
         """
-        await self._set_busy(f"Generating schema: {model_name}")
+        await self._set_busy("Generating schema: %s", model_name)
 
         # TODO: Implement AI-powered schema generation
         fields_str = "\n    ".join(
@@ -212,7 +212,7 @@ class {model_name}(BaseModel):
         Returns:
             str: Generated authentication code.
         """
-        await self._set_busy(f"Generating {auth_type} authentication")
+        await self._set_busy("Generating %s authentication", auth_type)
 
         # TODO: Implement AI-powered auth generation
         auth_code = f"""
@@ -6,36 +6,86 @@ All specialized agents inherit from BaseAgent and implement its abstract methods
 """
 
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from enum import Enum
+from datetime import datetime, timezone
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from backend.core.ai_clients.provider_manager import ProviderManager
+from backend.models.messages import AgentState
 from backend.models.schemas import AgentStatus, Message
 
 
-class AgentState(str, Enum):
-    """Enumeration of possible agent states."""
+class StatusSnapshot(NamedTuple):
+    """Lightweight agent status for internal callers; see get_status_fast."""
 
-    IDLE = "idle"
-    BUSY = "busy"
-    WAITING = "waiting"
-    ERROR = "error"
-    OFFLINE = "offline"
+    name: str
+    status: str
+    current_task: str | None
 
 
-# Singleton provider manager for all agents
-_provider_manager: ProviderManager | None = None
+# Agent loggers by agent name, so pooled agents skip the logging registry
+_logger_cache: dict[str, logging.Logger] = {}
 
 
+@cache
 def get_provider_manager() -> ProviderManager:
-    """Get or create the shared provider manager instance."""
-    global _provider_manager
-    if _provider_manager is None:
-        _provider_manager = ProviderManager()
-    return _provider_manager
+    """
+    Get or create the shared provider manager instance.
+
+    The instance is created on first call and reused by every agent; call
+    get_provider_manager.cache_clear() to reset it.
+    """
+    return ProviderManager()
+
+
+@lru_cache(maxsize=128)
+def _read_prompt(path: str) -> str | None:
+    """
+    Read a system prompt file, shared by every agent that uses it.
+
+    Call _read_prompt.cache_clear() to pick up edited prompt files.
+
+    Args:
+        path: Path to the prompt file.
+
+    Returns:
+        str | None: The prompt text, or None if the file does not exist.
+    """
+    if not os.path.isfile(path):
+        return None
+    with open(path, "rb") as prompt_file:
+        return prompt_file.read().decode("utf-8")
+
+
+def _find_fences(text: str, language: str = "") -> tuple[int, int]:
+    """
+    Find the code between markdown fences in a stripped AI response.
+
+    Args:
+        text: The response, already stripped of surrounding whitespace.
+        language: Optional language hint for the opening fence.
+
+    Returns:
+        tuple[int, int]: Start and end offsets of the code in text.
+    """
+    start, end = 0, len(text)
+    # Skip a language-specific opening fence
+    if language:
+        prefix = f"```{language}"
+        if text.startswith(prefix):
+            start = len(prefix)
+    # Skip a generic opening fence
+    if text.startswith("```", start):
+        # Find the first newline to skip the language tag if any
+        first_newline = text.find("\n", start)
+        start = first_newline + 1 if first_newline != -1 else start + 3
+    if end - start >= 3 and text.endswith("```"):
+        end -= 3
+    return start, end
 
 
 class BaseAgent(ABC):
@@ -83,8 +133,12 @@ class BaseAgent(ABC):
         self._status = AgentState.IDLE
         self._message_bus = message_bus
         self._current_task: str | None = None
-        self._created_at = datetime.utcnow()
-        self.logger = logging.getLogger(f"agent.{name}")
+        self._current_task_args: tuple[Any, ...] = ()
+        self._status_cache: AgentStatus | None = None
+        self._created_at_ns = time.time_ns()
+        self.logger = _logger_cache.get(name) or _logger_cache.setdefault(
+            name, logging.getLogger(f"agent.{name}")
+        )
         self._system_prompt: str | None = None
         self._load_system_prompt()
 
@@ -92,17 +146,20 @@ class BaseAgent(ABC):
         """Load the system prompt from the prompts directory."""
         # Convert agent name to prompt filename
         prompt_name = self._name.lower().replace(" ", "_")
-        prompt_file = self.PROMPTS_DIR / f"{prompt_name}_prompt.txt"
-
-        if prompt_file.exists():
-            try:
-                self._system_prompt = prompt_file.read_text(encoding="utf-8")
-                self.logger.debug(f"Loaded system prompt from {prompt_file}")
-            except Exception as e:
-                self.logger.warning(f"Failed to load system prompt: {e}")
-                self._system_prompt = None
-        else:
+        # A plain string path, so the shared reader's cache key is cheap
+        prompt_file = os.path.join(self.PROMPTS_DIR, f"{prompt_name}_prompt.txt")
+
+        try:
+            self._system_prompt = _read_prompt(prompt_file)
+        except Exception as e:
+            self.logger.warning(f"Failed to load system prompt: {e}")
+            self._system_prompt = None
+            return
+
+        if self._system_prompt is None:
             self.logger.debug(f"No system prompt file found at {prompt_file}")
+        else:
+            self.logger.debug(f"Loaded system prompt from {prompt_file}")
 
     @property
     def name(self) -> str:
@@ -128,6 +185,7 @@ class BaseAgent(ABC):
     def status(self, value: AgentState) -> None:
         """Set the agent's status."""
         self._status = value
+        self._status_cache = None
         self.logger.info(f"Status changed to: {value}")
 
     @property
@@ -143,7 +201,12 @@ class BaseAgent(ABC):
     @property
     def current_task(self) -> str | None:
         """Get the current task being processed."""
-        return self._current_task
+        return self._task_description()
+
+    @property
+    def created_at(self) -> datetime:
+        """Get when the agent was created, in UTC."""
+        return datetime.fromtimestamp(self._created_at_ns / 1e9, tz=timezone.utc)
 
     @property
     def system_prompt(self) -> str | None:
@@ -159,14 +222,32 @@ class BaseAgent(ABC):
         """
         Get the agent's status as a Pydantic model.
 
+        The model is built once per state change and reused until the
+        status or current task changes again.
+
         Returns:
             AgentStatus: The current status of the agent.
         """
-        return AgentStatus(
-            name=self._name,
-            status=self._status.value,
-            current_task=self._current_task,
-        )
+        if self._status_cache is None:
+            # AgentState members are str instances; pydantic stores the value
+            self._status_cache = AgentStatus(
+                name=self._name,
+                status=self._status,
+                current_task=self._task_description(),
+            )
+        return self._status_cache
+
+    def get_status_fast(self) -> StatusSnapshot:
+        """
+        Get the agent's status without building a Pydantic model.
+
+        Carries the same fields as get_status(), for callers that do not
+        need validation or the API model.
+
+        Returns:
+            StatusSnapshot: The current status of the agent.
+        """
+        return StatusSnapshot(self._name, self._status, self._task_description())
 
     async def get_ai_response(
         self,
@@ -193,12 +274,20 @@ class BaseAgent(ABC):
         effective_system_prompt = system_prompt or self._system_prompt
 
         try:
-            response, provider = await self.ai_client.generate(
-                prompt=prompt,
-                system_prompt=effective_system_prompt,
-                **kwargs,
-            )
-            self.logger.debug(f"Generated response using {provider}")
+            # Most callers pass no extra options; skip re-packing kwargs then
+            if not kwargs:
+                response, provider = await self.ai_client.generate(
+                    prompt=prompt,
+                    system_prompt=effective_system_prompt,
+                )
+            else:
+                response, provider = await self.ai_client.generate(
+                    prompt=prompt,
+                    system_prompt=effective_system_prompt,
+                    **kwargs,
+                )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Generated response using {provider}")
             return response
         except Exception as e:
             self.logger.error(f"AI generation failed: {e}")
@@ -249,11 +338,8 @@ class BaseAgent(ABC):
 
         Returns:
             Message: The response message after processing.
-
-        Raises:
-            NotImplementedError: If the child class doesn't implement this method.
         """
-        raise NotImplementedError("Subclasses must implement process()")
+        ...
 
     @abstractmethod
     async def send_message(
@@ -272,11 +358,8 @@ class BaseAgent(ABC):
 
         Returns:
             bool: True if the message was sent successfully, False otherwise.
-
-        Raises:
-            NotImplementedError: If the child class doesn't implement this method.
         """
-        raise NotImplementedError("Subclasses must implement send_message()")
+        ...
 
     @abstractmethod
     async def receive_message(self, message: Message) -> None:
@@ -288,11 +371,8 @@ class BaseAgent(ABC):
 
         Args:
             message: The received message to handle.
-
-        Raises:
-            NotImplementedError: If the child class doesn't implement this method.
         """
-        raise NotImplementedError("Subclasses must implement receive_message()")
+        ...
 
     async def _log_activity(self, action: str, details: str | None = None) -> None:
         """
@@ -307,28 +387,55 @@ class BaseAgent(ABC):
             log_message += f": {details}"
         self.logger.info(log_message)
 
-    async def _set_busy(self, task: str) -> None:
+    def _task_description(self) -> str | None:
+        """
+        Get the current task description, formatting it on first use.
+
+        Returns:
+            str | None: The task description, or None when idle.
+        """
+        if self._current_task_args:
+            self._current_task = self._current_task % self._current_task_args
+            self._current_task_args = ()
+        return self._current_task
+
+    async def _set_busy(self, task: str, *args: Any) -> None:
         """
         Set the agent to busy status with a specific task.
 
+        When args are given, task is a %-format string that is only
+        formatted once the description is actually logged or read.
+
         Args:
             task: Description of the current task.
+            *args: Values to format into the description.
         """
         self._status = AgentState.BUSY
         self._current_task = task
-        await self._log_activity("Started task", task)
+        self._current_task_args = args
+        self._status_cache = None
+        if self.logger.isEnabledFor(logging.INFO):
+            await self._log_activity("Started task", self._task_description())
 
     async def _set_idle(self) -> None:
         """Set the agent to idle status after completing a task."""
-        previous_task = self._current_task
+        # Nothing to release or log when the agent is already idle
+        if self._status is AgentState.IDLE and self._current_task is None:
+            return
+        previous_task = None
+        if self._current_task and self.logger.isEnabledFor(logging.INFO):
+            previous_task = self._task_description()
         self._status = AgentState.IDLE
         self._current_task = None
+        self._current_task_args = ()
+        self._status_cache = None
         if previous_task:
             await self._log_activity("Completed task", previous_task)
 
     async def _set_error(self, error: str) -> None:
         """Set the agent to error status."""
         self._status = AgentState.ERROR
+        self._status_cache = None
         await self._log_activity("Error occurred", error)
 
     @staticmethod
@@ -344,22 +451,10 @@ class BaseAgent(ABC):
             str: The cleaned code without markdown formatting.
         """
         clean = response.strip()
-        # Remove language-specific markdown code blocks
-        if language:
-            prefix = f"```{language}"
-            if clean.startswith(prefix):
-                clean = clean[len(prefix):]
-        # Remove generic markdown code blocks
-        if clean.startswith("```"):
-            # Find the first newline to skip the language tag if any
-            first_newline = clean.find("\n")
-            if first_newline != -1:
-                clean = clean[first_newline + 1:]
-            else:
-                clean = clean[3:]
-        if clean.endswith("```"):
-            clean = clean[:-3]
-        return clean.strip()
+        # Slice the code out once instead of copying the whole response
+        # for each fence removed
+        start, end = _find_fences(clean, language)
+        return clean[start:end].strip()
 
     def __repr__(self) -> str:
         """Return a string representation of the agent."""
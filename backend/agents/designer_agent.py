@@ -5,40 +5,91 @@ The Designer Agent creates color schemes, defines typography and spacing,
 and generates CSS variables for consistent styling.
 """
 
-from datetime import datetime
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from backend.agents.base_agent import BaseAgent
 from backend.models.schemas import Message
 
+# Decoder for pulling the first JSON object out of a free-form AI response
+_JSON_DECODER = json.JSONDecoder()
 
-class DesignerAgent(BaseAgent):
+# Most "{" positions tried before giving up. A failed decode costs time
+# proportional to its position in the text, so trying every brace would
+# be quadratic on brace-heavy responses that hold no JSON.
+_JSON_MAX_STARTS = 32
+
+
+def _find_json_object(text: str) -> dict[str, Any] | None:
     """
-    Designer Agent that handles visual design tasks.
+    Find the first JSON object embedded in an AI response.
 
-    The Designer creates color schemes, defines typography, spacing systems,
-    and generates CSS variables for consistent styling across projects.
+    Decoding starts at each "{" in turn, up to _JSON_MAX_STARTS of them,
+    so nested objects and braces inside strings are handled without a
+    regex.
 
-    Attributes:
-        color_palettes: Dictionary of generated color palettes.
-        design_tokens: Dictionary of design tokens.
+    Args:
+        text: The raw AI response.
 
-    Example:
-        >>> designer = DesignerAgent()
-        >>> palette = await designer.create_color_scheme("modern", "blue")
+    Returns:
+        dict | None: The first decodable JSON object, or None if there is none.
     """
-
-    # Predefined color harmonies
-    COLOR_HARMONIES = {
+    start = text.find("{")
+    for _ in range(_JSON_MAX_STARTS):
+        if start == -1:
+            break
+        try:
+            value = _JSON_DECODER.raw_decode(text, start)[0]
+        except (ValueError, RecursionError):
+            # RecursionError: nesting too deep for the decoder
+            pass
+        else:
+            if isinstance(value, dict):
+                return value
+        start = text.find("{", start + 1)
+    return None
+
+
+# Predefined color harmonies
+_COLOR_HARMONIES: Mapping[str, str] = MappingProxyType(
+    {
         "complementary": "colors opposite on the color wheel",
         "analogous": "colors adjacent on the color wheel",
         "triadic": "three colors equally spaced on the color wheel",
         "split-complementary": "a color and two colors adjacent to its complement",
         "monochromatic": "variations of a single color",
     }
+)
+
+# Palette used when the AI does not return usable colors
+_DEFAULT_PALETTE: Mapping[str, str] = MappingProxyType(
+    {
+        "primary": "#3B82F6",
+        "primary-light": "#60A5FA",
+        "primary-dark": "#2563EB",
+        "secondary": "#8B5CF6",
+        "secondary-light": "#A78BFA",
+        "secondary-dark": "#7C3AED",
+        "accent": "#F59E0B",
+        "background": "#FFFFFF",
+        "surface": "#F3F4F6",
+        "text": "#1F2937",
+        "text-muted": "#6B7280",
+        "success": "#10B981",
+        "warning": "#F59E0B",
+        "error": "#EF4444",
+        "info": "#3B82F6",
+    }
+)
 
-    # Typography scale ratios
-    TYPE_SCALES = {
+# Typography scale ratios
+_TYPE_SCALES: Mapping[str, float] = MappingProxyType(
+    {
         "minor-second": 1.067,
         "major-second": 1.125,
         "minor-third": 1.200,
@@ -48,6 +99,107 @@ class DesignerAgent(BaseAgent):
         "perfect-fifth": 1.500,
         "golden-ratio": 1.618,
     }
+)
+
+# ratio ** 2 .. ratio ** 5 for each known scale ratio, computed once
+_TYPE_SCALE_POWERS: dict[float, tuple[float, float, float, float]] = {
+    ratio: (ratio**2, ratio**3, ratio**4, ratio**5)
+    for ratio in _TYPE_SCALES.values()
+}
+
+
+@lru_cache(maxsize=32)
+def _spacing_scale(base_unit: int) -> dict[str, int]:
+    """
+    Build the spacing scale for a base unit, shared across calls.
+
+    The returned dict is cached; callers must copy it before handing it out.
+
+    Args:
+        base_unit: Base spacing unit in pixels.
+
+    Returns:
+        dict: Spacing scale.
+    """
+    return {
+        "0": 0,
+        "px": 1,
+        "0.5": base_unit // 2,
+        "1": base_unit,
+        "1.5": base_unit + base_unit // 2,
+        "2": base_unit * 2,
+        "2.5": base_unit * 2 + base_unit // 2,
+        "3": base_unit * 3,
+        "4": base_unit * 4,
+        "5": base_unit * 5,
+        "6": base_unit * 6,
+        "8": base_unit * 8,
+        "10": base_unit * 10,
+        "12": base_unit * 12,
+        "16": base_unit * 16,
+        "20": base_unit * 20,
+        "24": base_unit * 24,
+        "32": base_unit * 32,
+        "40": base_unit * 40,
+        "48": base_unit * 48,
+        "64": base_unit * 64,
+    }
+
+
+@lru_cache(maxsize=64)
+def _type_sizes(base_size: int, ratio: float) -> dict[str, int]:
+    """
+    Build the font size scale for a base size and ratio, shared across calls.
+
+    The returned dict is cached; callers must copy it before handing it out.
+
+    Args:
+        base_size: Base font size in pixels.
+        ratio: Typography scale ratio.
+
+    Returns:
+        dict: Font sizes in pixels by size name.
+    """
+    powers = _TYPE_SCALE_POWERS.get(ratio)
+    if powers is None:
+        powers = (ratio**2, ratio**3, ratio**4, ratio**5)
+    squared, cubed, fourth, fifth = powers
+    return {
+        "xs": round(base_size / squared),
+        "sm": round(base_size / ratio),
+        "base": base_size,
+        "lg": round(base_size * ratio),
+        "xl": round(base_size * squared),
+        "2xl": round(base_size * cubed),
+        "3xl": round(base_size * fourth),
+        "4xl": round(base_size * fifth),
+    }
+
+
+class DesignerAgent(BaseAgent):
+    """
+    Designer Agent that handles visual design tasks.
+
+    The Designer creates color schemes, defines typography, spacing systems,
+    and generates CSS variables for consistent styling across projects.
+
+    Attributes:
+        color_palettes: Dictionary of generated color palettes.
+        design_tokens: Dictionary of design tokens.
+
+    Example:
+        >>> designer = DesignerAgent()
+        >>> palette = await designer.create_color_scheme("modern", "blue")
+    """
+
+    # Predefined color harmonies
+    COLOR_HARMONIES = _COLOR_HARMONIES
+
+    # Typography scale ratios
+    TYPE_SCALES = _TYPE_SCALES
+
+    # Number of AI-generated palettes kept for reuse
+    PALETTE_CACHE_SIZE = 64
 
     def __init__(
         self,
@@ -66,6 +218,13 @@ class DesignerAgent(BaseAgent):
         super().__init__(name=name, model=model, message_bus=message_bus)
         self._color_palettes: dict[str, dict[str, str]] = {}
         self._design_tokens: dict[str, Any] = {}
+        # AI-generated palettes by (style, primary color, harmony)
+        self._palette_cache: OrderedDict[tuple[str, str, str], dict[str, str]] = (
+            OrderedDict()
+        )
+        # Last rendered CSS variables by prefix, with the token snapshot
+        # they were rendered from
+        self._css_cache: dict[str, tuple[tuple[Any, ...], str]] = {}
 
     async def process(self, message: Message) -> Message:
         """
@@ -77,9 +236,11 @@ class DesignerAgent(BaseAgent):
         Returns:
             Message: Response with design output.
         """
-        await self._set_busy(f"Designing: {message.content[:50]}")
+        await self._set_busy("Designing: %.50s", message.content)
 
         try:
+            # One lowered copy and plain substring checks; checked in priority
+            # order, so "font color" is a color request
             content = message.content.lower()
 
             if "color" in content or "palette" in content:
@@ -119,7 +280,7 @@ class DesignerAgent(BaseAgent):
             to_agent=message.from_agent,
             content=response_content,
             message_type="response",
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
     async def send_message(
@@ -175,26 +336,36 @@ class DesignerAgent(BaseAgent):
         Returns:
             dict: Color palette with named colors.
         """
-        await self._set_busy(f"Creating {style} color scheme")
-
-        # Default color palette
-        palette = {
-            "primary": "#3B82F6",
-            "primary-light": "#60A5FA",
-            "primary-dark": "#2563EB",
-            "secondary": "#8B5CF6",
-            "secondary-light": "#A78BFA",
-            "secondary-dark": "#7C3AED",
-            "accent": "#F59E0B",
-            "background": "#FFFFFF",
-            "surface": "#F3F4F6",
-            "text": "#1F2937",
-            "text-muted": "#6B7280",
-            "success": "#10B981",
-            "warning": "#F59E0B",
-            "error": "#EF4444",
-            "info": "#3B82F6",
-        }
+        await self._set_busy("Creating %s color scheme", style)
+        palette = await self._build_color_scheme(style, primary_color, harmony)
+        await self._set_idle()
+        return palette
+
+    async def _build_color_scheme(
+        self,
+        style: str = "modern",
+        primary_color: str = "blue",
+        harmony: str = "complementary",
+    ) -> dict[str, str]:
+        """
+        Build a color scheme and store it, without touching agent status.
+
+        Args:
+            style: Design style (modern, classic, minimal, vibrant).
+            primary_color: Base primary color.
+            harmony: Color harmony type.
+
+        Returns:
+            dict: Color palette with named colors.
+        """
+        # Reuse a palette the AI already produced for the same request
+        cache_key = (style, primary_color, harmony)
+        cached = self._palette_cache.get(cache_key)
+        if cached is not None:
+            self._palette_cache.move_to_end(cache_key)
+            return self._store_palette(style, primary_color, dict(cached))
+
+        palette = dict(_DEFAULT_PALETTE)
 
         try:
             prompt = f"""Create a {style} color scheme with {primary_color} as \
@@ -214,23 +385,45 @@ Only return the JSON, no explanation."""
 
             response = await self.get_ai_response(prompt)
 
-            # Try to parse JSON from response
-            import json
-            import re
-
-            # Extract JSON from response
-            json_match = re.search(r"\{[^{}]+\}", response, re.DOTALL)
-            if json_match:
-                parsed = json.loads(json_match.group())
-                palette.update(parsed)
+            # Extract JSON from response, keeping only string color values
+            parsed = _find_json_object(response)
+            if parsed:
+                # Models sometimes wrap the palette as {"colors": {...}}
+                colors = parsed.get("colors", parsed)
+                if isinstance(colors, dict):
+                    palette.update(
+                        (name, value)
+                        for name, value in colors.items()
+                        if isinstance(value, str)
+                    )
+                    self._palette_cache[cache_key] = dict(palette)
+                    if len(self._palette_cache) > self.PALETTE_CACHE_SIZE:
+                        self._palette_cache.popitem(last=False)
 
         except Exception as e:
             self.logger.warning(f"Could not generate custom palette: {e}")
 
+        return self._store_palette(style, primary_color, palette)
+
+    def _store_palette(
+        self,
+        style: str,
+        primary_color: str,
+        palette: dict[str, str],
+    ) -> dict[str, str]:
+        """
+        Record a palette as the current color tokens.
+
+        Args:
+            style: Design style the palette was made for.
+            primary_color: Primary color the palette was made for.
+            palette: The color palette.
+
+        Returns:
+            dict: The same palette.
+        """
         self._color_palettes[f"{style}_{primary_color}"] = palette
         self._design_tokens["colors"] = palette
-
-        await self._set_idle()
         return palette
 
     async def create_typography_system(
@@ -251,20 +444,31 @@ Only return the JSON, no explanation."""
             dict: Typography system with sizes and settings.
         """
         await self._set_busy("Creating typography system")
+        typography = self._build_typography_system(base_size, scale, font_family)
+        await self._set_idle()
+        return typography
+
+    def _build_typography_system(
+        self,
+        base_size: int = 16,
+        scale: str = "major-third",
+        font_family: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build a typography system and store it, without touching agent status.
+
+        Args:
+            base_size: Base font size in pixels.
+            scale: Typography scale ratio name.
+            font_family: Optional font family.
 
+        Returns:
+            dict: Typography system with sizes and settings.
+        """
         ratio = self.TYPE_SCALES.get(scale, 1.250)
 
         # Generate sizes based on scale
-        sizes = {
-            "xs": round(base_size / (ratio ** 2)),
-            "sm": round(base_size / ratio),
-            "base": base_size,
-            "lg": round(base_size * ratio),
-            "xl": round(base_size * (ratio ** 2)),
-            "2xl": round(base_size * (ratio ** 3)),
-            "3xl": round(base_size * (ratio ** 4)),
-            "4xl": round(base_size * (ratio ** 5)),
-        }
+        sizes = dict(_type_sizes(base_size, ratio))
 
         # Font families
         default_font = (
@@ -302,8 +506,6 @@ Only return the JSON, no explanation."""
         }
 
         self._design_tokens["typography"] = typography
-
-        await self._set_idle()
         return typography
 
     async def create_spacing_system(
@@ -320,34 +522,22 @@ Only return the JSON, no explanation."""
             dict: Spacing scale.
         """
         await self._set_busy("Creating spacing system")
+        spacing = self._build_spacing_system(base_unit)
+        await self._set_idle()
+        return spacing
 
-        spacing = {
-            "0": 0,
-            "px": 1,
-            "0.5": base_unit // 2,
-            "1": base_unit,
-            "1.5": base_unit + base_unit // 2,
-            "2": base_unit * 2,
-            "2.5": base_unit * 2 + base_unit // 2,
-            "3": base_unit * 3,
-            "4": base_unit * 4,
-            "5": base_unit * 5,
-            "6": base_unit * 6,
-            "8": base_unit * 8,
-            "10": base_unit * 10,
-            "12": base_unit * 12,
-            "16": base_unit * 16,
-            "20": base_unit * 20,
-            "24": base_unit * 24,
-            "32": base_unit * 32,
-            "40": base_unit * 40,
-            "48": base_unit * 48,
-            "64": base_unit * 64,
-        }
+    def _build_spacing_system(self, base_unit: int = 4) -> dict[str, int]:
+        """
+        Build a spacing system and store it, without touching agent status.
 
-        self._design_tokens["spacing"] = spacing
+        Args:
+            base_unit: Base spacing unit in pixels.
 
-        await self._set_idle()
+        Returns:
+            dict: Spacing scale.
+        """
+        spacing = dict(_spacing_scale(base_unit))
+        self._design_tokens["spacing"] = spacing
         return spacing
 
     async def generate_css_variables(
@@ -367,49 +557,75 @@ Only return the JSON, no explanation."""
 
         # Ensure we have design tokens
         if "colors" not in self._design_tokens:
-            await self.create_color_scheme()
+            await self._build_color_scheme()
         if "typography" not in self._design_tokens:
-            await self.create_typography_system()
+            self._build_typography_system()
         if "spacing" not in self._design_tokens:
-            await self.create_spacing_system()
+            self._build_spacing_system()
 
-        css_lines = [":root {"]
+        css_content = self._render_css_variables(prefix)
 
-        # Color variables
-        colors = self._design_tokens.get("colors", {})
-        for name, value in colors.items():
-            var_name = f"--{prefix}color-{name}" if prefix else f"--color-{name}"
-            css_lines.append(f"  {var_name}: {value};")
+        await self._set_idle()
+        return css_content
 
-        css_lines.append("")
+    def _render_css_variables(self, prefix: str = "") -> str:
+        """
+        Render CSS custom properties from the current design tokens.
 
-        # Typography variables
+        The result is kept per prefix and reused while the tokens it was
+        rendered from are unchanged, so edits made through the dicts returned
+        by the builders are still picked up.
+
+        Args:
+            prefix: Optional prefix for CSS variable names.
+
+        Returns:
+            str: CSS custom properties declaration.
+        """
+        colors = self._design_tokens.get("colors", {})
         typography = self._design_tokens.get("typography", {})
         sizes = typography.get("sizes", {})
-        for name, value in sizes.items():
-            if prefix:
-                var_name = f"--{prefix}font-size-{name}"
-            else:
-                var_name = f"--font-size-{name}"
-            css_lines.append(f"  {var_name}: {value}px;")
+        spacing = self._design_tokens.get("spacing", {})
+        snapshot = (
+            tuple(colors.items()),
+            tuple(sizes.items()),
+            typography.get("font_family"),
+            tuple(spacing.items()),
+        )
+        cached = self._css_cache.get(prefix)
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
 
-        if typography.get("font_family"):
-            var_name = f"--{prefix}font-family" if prefix else "--font-family"
-            css_lines.append(f"  {var_name}: {typography['font_family']};")
+        # Each variable name starts with the same head, so build it once
+        color_head = f"  --{prefix}color-"
+        size_head = f"  --{prefix}font-size-"
+        spacing_head = f"  --{prefix}spacing-"
+        parts = [":root {\n"]
+
+        # Color variables
+        parts.extend(
+            [f"{color_head}{name}: {value};\n" for name, value in colors.items()]
+        )
+        parts.append("\n")
 
-        css_lines.append("")
+        # Typography variables
+        parts.extend(
+            [f"{size_head}{name}: {value}px;\n" for name, value in sizes.items()]
+        )
 
-        # Spacing variables
-        spacing = self._design_tokens.get("spacing", {})
-        for name, value in spacing.items():
-            var_name = f"--{prefix}spacing-{name}" if prefix else f"--spacing-{name}"
-            css_lines.append(f"  {var_name}: {value}px;")
+        if typography.get("font_family"):
+            parts.append(f"  --{prefix}font-family: {typography['font_family']};\n")
 
-        css_lines.append("}")
+        parts.append("\n")
 
-        css_content = "\n".join(css_lines)
+        # Spacing variables
+        parts.extend(
+            [f"{spacing_head}{name}: {value}px;\n" for name, value in spacing.items()]
+        )
+        parts.append("}")
 
-        await self._set_idle()
+        css_content = "".join(parts)
+        self._css_cache[prefix] = (snapshot, css_content)
         return css_content
 
     async def generate_design_system(
@@ -430,11 +646,12 @@ Only return the JSON, no explanation."""
         style = project_info.get("style", "modern") if project_info else "modern"
         primary = project_info.get("primary_color", "blue") if project_info else "blue"
 
-        # Generate all components
-        colors = await self.create_color_scheme(style, primary)
-        typography = await self.create_typography_system()
-        spacing = await self.create_spacing_system()
-        css_variables = await self.generate_css_variables()
+        # Generate all components under this one busy task; only the color
+        # scheme awaits the AI, the rest is local computation
+        colors = await self._build_color_scheme(style, primary)
+        typography = self._build_typography_system()
+        spacing = self._build_spacing_system()
+        css_variables = self._render_css_variables()
 
         design_system = {
             "colors": colors,
@@ -482,15 +699,17 @@ Only return the JSON, no explanation."""
         await self._set_idle()
         return design_system
 
-    async def get_design_tokens(self) -> dict[str, Any]:
-        """Get all design tokens."""
-        return self._design_tokens.copy()
+    async def get_design_tokens(self) -> Mapping[str, Any]:
+        """Get a read-only view of all design tokens."""
+        return MappingProxyType(self._design_tokens)
 
-    async def get_color_palettes(self) -> dict[str, dict[str, str]]:
-        """Get all generated color palettes."""
-        return self._color_palettes.copy()
+    async def get_color_palettes(self) -> Mapping[str, dict[str, str]]:
+        """Get a read-only view of all generated color palettes."""
+        return MappingProxyType(self._color_palettes)
 
     def clear_tokens(self) -> None:
         """Clear all design tokens."""
         self._design_tokens.clear()
         self._color_palettes.clear()
+        self._palette_cache.clear()
+        self._css_cache.clear()
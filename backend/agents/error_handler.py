@@ -5,7 +5,12 @@ The Error Handler Agent analyzes errors from other agents,
 categorizes them, and decides on appropriate actions.
 """
 
-from datetime import datetime
+import asyncio
+import re
+from collections import Counter, OrderedDict, deque
+from collections.abc import Hashable
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
@@ -35,35 +40,112 @@ class ErrorAction(str, Enum):
     FIX = "fix"
 
 
+# Keywords for each error category, checked in priority order; the first
+# category with a keyword in the lowered message wins
+_CATEGORY_KEYWORDS: tuple[tuple[ErrorCategory, tuple[str, ...]], ...] = (
+    (ErrorCategory.SYNTAX, ("syntax", "parse", "unexpected token", "invalid")),
+    (
+        ErrorCategory.API,
+        ("api", "rate limit", "unauthorized", "forbidden", "401", "403"),
+    ),
+    (ErrorCategory.TIMEOUT, ("timeout", "timed out", "deadline")),
+    (ErrorCategory.NETWORK, ("network", "connection", "dns", "unreachable")),
+    (
+        ErrorCategory.RUNTIME,
+        (
+            "runtime",
+            "exception",
+            "null",
+            "undefined",
+            "type error",
+            "reference error",
+        ),
+    ),
+    (ErrorCategory.LOGIC, ("assertion", "expect", "logic", "condition")),
+)
+
+# Parts of an error message that vary between occurrences of the same error:
+# hex addresses, numbers (line numbers, ports, ids) and file paths
+_ERROR_VARIABLE_PARTS = re.compile(r"\b0x[0-9a-fA-F]+\b|\b\d+\b|/[^\s:]+")
+
+# Start of each numbered answer in a batched suggestion response, e.g. "2. "
+_NUMBERED_ITEM = re.compile(r"^\s*(\d+)[.)]\s*", re.MULTILINE)
+
+# Returned when no AI suggestion is available for an error
+_FALLBACK_SUGGESTION = "Review the error message and check related code."
+
+
+def _error_signature(error_message: str) -> str:
+    """
+    Normalize an error message so repeats of the same error share a key.
+
+    Args:
+        error_message: The error message.
+
+    Returns:
+        str: The message with addresses, numbers and paths replaced.
+    """
+    return _ERROR_VARIABLE_PARTS.sub("<N>", error_message)
+
+
+def _split_numbered_response(response: str) -> dict[int, str]:
+    """
+    Split a numbered-list AI response into its items.
+
+    Args:
+        response: Response text with items starting "1.", "2.", ...
+
+    Returns:
+        dict: Item text by item number; unnumbered text is ignored.
+    """
+    markers = list(_NUMBERED_ITEM.finditer(response))
+    items: dict[int, str] = {}
+    for index, marker in enumerate(markers):
+        end = markers[index + 1].start() if index + 1 < len(markers) else None
+        items.setdefault(int(marker.group(1)), response[marker.end() : end].strip())
+    return items
+
+
+def _retry_key(error_message: str, context: dict[str, Any] | None) -> Hashable:
+    """
+    Build the key that retries of the same failure are counted under.
+
+    Args:
+        error_message: The error message, used when there is no context.
+        context: Optional context about where the error occurred.
+
+    Returns:
+        Hashable: The context items when hashable, else a string form.
+    """
+    if not context:
+        return error_message[:50]
+    try:
+        return frozenset(context.items())
+    except TypeError:
+        # Nested lists or dicts in the context are not hashable
+        return str(context)
+
+
+@dataclass(slots=True)
 class ErrorAnalysis:
-    """Result of analyzing an error."""
+    """
+    Result of analyzing an error.
 
-    def __init__(
-        self,
-        error_message: str,
-        category: ErrorCategory,
-        action: ErrorAction,
-        suggestion: str | None = None,
-        retry_count: int = 0,
-        max_retries: int = 3,
-    ) -> None:
-        """
-        Initialize error analysis result.
+    Attributes:
+        error_message: The original error message.
+        category: The category of the error.
+        action: The recommended action.
+        suggestion: Optional suggested fix.
+        retry_count: Current retry count.
+        max_retries: Maximum allowed retries.
+    """
 
-        Args:
-            error_message: The original error message.
-            category: The category of the error.
-            action: The recommended action.
-            suggestion: Optional suggested fix.
-            retry_count: Current retry count.
-            max_retries: Maximum allowed retries.
-        """
-        self.error_message = error_message
-        self.category = category
-        self.action = action
-        self.suggestion = suggestion
-        self.retry_count = retry_count
-        self.max_retries = max_retries
+    error_message: str
+    category: ErrorCategory
+    action: ErrorAction
+    suggestion: str | None = None
+    retry_count: int = 0
+    max_retries: int = 3
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
@@ -93,6 +175,17 @@ class ErrorHandlerAgent(BaseAgent):
         >>> analysis = await handler.analyze_error(error_message, context)
     """
 
+    # Number of distinct error signatures whose AI fix suggestions are kept
+    SUGGESTION_CACHE_SIZE = 512
+
+    # Fix suggestion requests arriving within this many seconds of each other
+    # share one AI call, up to SUGGESTION_BATCH_SIZE errors per call
+    SUGGESTION_BATCH_WINDOW = 0.03
+    SUGGESTION_BATCH_SIZE = 8
+
+    # Number of most recent error analyses kept in the history
+    ERROR_HISTORY_SIZE = 10_000
+
     def __init__(
         self,
         name: str = "ErrorHandler",
@@ -108,8 +201,18 @@ class ErrorHandlerAgent(BaseAgent):
             message_bus: Reference to the message bus for communication.
         """
         super().__init__(name=name, model=model, message_bus=message_bus)
-        self._error_history: list[ErrorAnalysis] = []
-        self._retry_counts: dict[str, int] = {}
+        self._error_history: deque[ErrorAnalysis] = deque(
+            maxlen=self.ERROR_HISTORY_SIZE
+        )
+        # Running totals for get_error_stats, kept in step with the history
+        self._category_counts: Counter[str] = Counter()
+        self._action_counts: Counter[str] = Counter()
+        self._retry_counts: dict[Hashable, int] = {}
+        self._suggestion_cache: OrderedDict[str, str] = OrderedDict()
+        # Suggestion requests waiting for the next batch, by error signature
+        self._pending_suggestions: dict[str, tuple[str, asyncio.Future[str]]] = {}
+        self._suggestion_timer: asyncio.TimerHandle | None = None
+        self._suggestion_batches: set[asyncio.Task[None]] = set()
 
     async def process(self, message: Message) -> Message:
         """
@@ -121,7 +224,7 @@ class ErrorHandlerAgent(BaseAgent):
         Returns:
             Message: Response with error analysis.
         """
-        await self._set_busy(f"Analyzing error: {message.content[:50]}")
+        await self._set_busy("Analyzing error: %.50s", message.content)
 
         try:
             # Analyze the error
@@ -149,7 +252,7 @@ class ErrorHandlerAgent(BaseAgent):
             to_agent=message.from_agent,
             content=response_content,
             message_type="response",
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
     async def send_message(
@@ -209,7 +312,7 @@ class ErrorHandlerAgent(BaseAgent):
         category = self._categorize_error(error_message)
 
         # Get retry count for this context
-        context_key = str(context) if context else error_message[:50]
+        context_key = _retry_key(error_message, context)
         retry_count = self._retry_counts.get(context_key, 0)
 
         # Determine action based on category and retry count
@@ -230,11 +333,31 @@ class ErrorHandlerAgent(BaseAgent):
         if action == ErrorAction.RETRY:
             self._retry_counts[context_key] = retry_count + 1
 
-        self._error_history.append(analysis)
+        self._record_analysis(analysis)
 
         await self._set_idle()
         return analysis
 
+    def _record_analysis(self, analysis: ErrorAnalysis) -> None:
+        """Store an analysis and keep the category/action counters in step."""
+        history = self._error_history
+        if len(history) == history.maxlen:
+            # Evict the oldest analysis ourselves so it leaves the counters
+            oldest = history.popleft()
+            self._forget_count(self._category_counts, oldest.category.value)
+            self._forget_count(self._action_counts, oldest.action.value)
+        history.append(analysis)
+        self._category_counts[analysis.category.value] += 1
+        self._action_counts[analysis.action.value] += 1
+
+    @staticmethod
+    def _forget_count(counts: Counter[str], key: str) -> None:
+        """Decrement a counter, dropping the key once it reaches zero."""
+        if counts[key] > 1:
+            counts[key] -= 1
+        else:
+            del counts[key]
+
     def _categorize_error(self, error_message: str) -> ErrorCategory:
         """
         Categorize an error based on its message.
@@ -246,52 +369,10 @@ class ErrorHandlerAgent(BaseAgent):
             ErrorCategory: The determined error category.
         """
         error_lower = error_message.lower()
-
-        # Syntax errors
-        if any(
-            kw in error_lower
-            for kw in ["syntax", "parse", "unexpected token", "invalid"]
-        ):
-            return ErrorCategory.SYNTAX
-
-        # API errors
-        if any(
-            kw in error_lower
-            for kw in ["api", "rate limit", "unauthorized", "forbidden", "401", "403"]
-        ):
-            return ErrorCategory.API
-
-        # Timeout errors
-        if any(kw in error_lower for kw in ["timeout", "timed out", "deadline"]):
-            return ErrorCategory.TIMEOUT
-
-        # Network errors
-        if any(
-            kw in error_lower
-            for kw in ["network", "connection", "dns", "unreachable"]
-        ):
-            return ErrorCategory.NETWORK
-
-        # Runtime errors
-        if any(
-            kw in error_lower
-            for kw in [
-                "runtime",
-                "exception",
-                "null",
-                "undefined",
-                "type error",
-                "reference error",
-            ]
-        ):
-            return ErrorCategory.RUNTIME
-
-        # Logic errors
-        if any(
-            kw in error_lower
-            for kw in ["assertion", "expect", "logic", "condition"]
-        ):
-            return ErrorCategory.LOGIC
+        for category, keywords in _CATEGORY_KEYWORDS:
+            for keyword in keywords:
+                if keyword in error_lower:
+                    return category
 
         return ErrorCategory.UNKNOWN
 
@@ -352,25 +433,102 @@ class ErrorHandlerAgent(BaseAgent):
         """
         Get an AI-powered suggestion to fix an error.
 
+        Suggestions are reused for errors that differ only in line numbers,
+        addresses or file paths. Requests made close together are sent to
+        the AI as one batch.
+
         Args:
             error_message: The error message.
 
         Returns:
             str: Suggested fix.
         """
-        prompt = f"""Analyze this error and suggest a fix:
+        key = _error_signature(error_message)
+        cached = self._suggestion_cache.get(key)
+        if cached is not None:
+            self._suggestion_cache.move_to_end(key)
+            return cached
+
+        pending = self._pending_suggestions.get(key)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = (error_message, loop.create_future())
+            self._pending_suggestions[key] = pending
+            if len(self._pending_suggestions) >= self.SUGGESTION_BATCH_SIZE:
+                self._start_suggestion_batch()
+            elif self._suggestion_timer is None:
+                self._suggestion_timer = loop.call_later(
+                    self.SUGGESTION_BATCH_WINDOW, self._start_suggestion_batch
+                )
+
+        # Shielded so one cancelled caller does not cancel others waiting
+        # on the same error
+        return await asyncio.shield(pending[1])
+
+    def _start_suggestion_batch(self) -> None:
+        """Send every pending suggestion request to the AI as one batch."""
+        if self._suggestion_timer is not None:
+            self._suggestion_timer.cancel()
+            self._suggestion_timer = None
+        if not self._pending_suggestions:
+            return
+
+        batch = self._pending_suggestions
+        self._pending_suggestions = {}
+        task = asyncio.ensure_future(self._run_suggestion_batch(batch))
+        self._suggestion_batches.add(task)
+        task.add_done_callback(self._suggestion_batches.discard)
+
+    async def _run_suggestion_batch(
+        self,
+        batch: dict[str, tuple[str, asyncio.Future[str]]],
+    ) -> None:
+        """
+        Get suggestions for a batch of errors and hand them to their callers.
+
+        Args:
+            batch: Error message and result future by error signature.
+        """
+        keys = list(batch)
+        suggestions: dict[str, str] = {}
+        try:
+            if len(keys) == 1:
+                error_message = batch[keys[0]][0]
+                prompt = f"""Analyze this error and suggest a fix:
 
 Error: {error_message}
 
 Provide a concise, actionable suggestion to fix this error.
 Focus on the most likely cause and solution."""
-
-        try:
-            response = await self.get_ai_response(prompt)
-            return response
+                suggestions[keys[0]] = await self.get_ai_response(prompt)
+            else:
+                errors = "\n".join(
+                    f"{number}. {batch[key][0]}"
+                    for number, key in enumerate(keys, start=1)
+                )
+                prompt = f"""Analyze each numbered error below and suggest a fix:
+
+{errors}
+
+Reply with one numbered item per error, using the same numbers.
+Give each a concise, actionable suggestion focused on the most likely
+cause and solution."""
+                items = _split_numbered_response(await self.get_ai_response(prompt))
+                for number, key in enumerate(keys, start=1):
+                    if items.get(number):
+                        suggestions[key] = items[number]
         except Exception as e:
             self.logger.warning(f"Could not get AI suggestion: {e}")
-            return "Review the error message and check related code."
+        finally:
+            # Always answer every caller, even if this batch was cancelled
+            for key, (_, future) in batch.items():
+                suggestion = suggestions.get(key)
+                if suggestion is not None:
+                    self._suggestion_cache[key] = suggestion
+                    if len(self._suggestion_cache) > self.SUGGESTION_CACHE_SIZE:
+                        self._suggestion_cache.popitem(last=False)
+                if not future.done():
+                    future.set_result(suggestion or _FALLBACK_SUGGESTION)
 
     async def suggest_fix(
         self,
@@ -434,23 +592,16 @@ Be concise and actionable."""
         Returns:
             dict: Error statistics.
         """
-        category_counts: dict[str, int] = {}
-        action_counts: dict[str, int] = {}
-
-        for analysis in self._error_history:
-            cat = analysis.category.value
-            act = analysis.action.value
-            category_counts[cat] = category_counts.get(cat, 0) + 1
-            action_counts[act] = action_counts.get(act, 0) + 1
-
         return {
             "total_errors": len(self._error_history),
-            "by_category": category_counts,
-            "by_action": action_counts,
+            "by_category": dict(self._category_counts),
+            "by_action": dict(self._action_counts),
             "active_retries": len(self._retry_counts),
         }
 
     def clear_history(self) -> None:
         """Clear error history and retry counts."""
         self._error_history.clear()
+        self._category_counts.clear()
+        self._action_counts.clear()
         self._retry_counts.clear()
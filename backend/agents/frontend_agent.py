@@ -58,7 +58,7 @@ class FrontendAgent(BaseAgent):
         Returns:
             Message: Response with development status.
         """
-        await self._set_busy(f"Building UI: {message.content[:50]}")
+        await self._set_busy("Building UI: %.50s", message.content)
 
         try:
             # Parse the request and generate appropriate code
@@ -439,7 +439,7 @@ document.addEventListener('DOMContentLoaded', () => {
         Returns:
             str: Generated React component code.
         """
-        await self._set_busy(f"Generating React component: {component_name}")
+        await self._set_busy("Generating React component: %s", component_name)
 
         try:
             props_info = f"Props: {', '.join(props)}" if props else "No props"
@@ -545,7 +545,7 @@ export default {component_name};
             content = await self.generate_javascript(specs)
         else:
             # For other types, generate based on description
-            await self._set_busy(f"Generating {file_path}")
+            await self._set_busy("Generating %s", file_path)
             try:
                 prompt = f"""Generate the content for file: {file_path}
 
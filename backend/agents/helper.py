@@ -5,13 +5,225 @@ The Helper Agent handles auxiliary tasks such as documentation,
 file organization, research, and other utility operations.
 """
 
-from datetime import datetime
+import json
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any
 
 from backend.agents.base_agent import BaseAgent
 from backend.core.ai_clients.base_client import AIClientError
 from backend.models.schemas import Message
 
+# package.json fields that follow name, version and description
+_PACKAGE_JSON_DEFAULTS: dict[str, Any] = {
+    "main": "index.js",
+    "scripts": {
+        "start": "http-server . -p 3000",
+        "dev": "http-server . -p 3000 -c-1",
+        "test": 'echo "No tests specified" && exit 0',
+    },
+    "keywords": [],
+    "author": "",
+    "license": "MIT",
+    "devDependencies": {"http-server": "^14.1.1"},
+}
+
+# The constant part of package.json, serialized once. It starts right after
+# the opening brace so the per-project fields can be placed in front of it.
+_PACKAGE_JSON_TAIL = json.dumps(
+    _PACKAGE_JSON_DEFAULTS, indent=2, ensure_ascii=False
+).removeprefix("{")
+
+# Encodes a single value as JSON, escaping quotes and backslashes
+_encode_json_value = json.JSONEncoder(ensure_ascii=False).encode
+
+# Folder each file extension is moved into by organize_files
+_EXTENSION_FOLDERS: dict[str, str] = {
+    "css": "css/",
+    "js": "js/",
+    "jsx": "js/",
+    "ts": "js/",
+    "tsx": "js/",
+    "png": "assets/images/",
+    "jpg": "assets/images/",
+    "jpeg": "assets/images/",
+    "gif": "assets/images/",
+    "svg": "assets/images/",
+    "webp": "assets/images/",
+}
+
+# Prompt for generate_readme, filled in on each call
+_README_PROMPT_TEMPLATE = """Create a professional README.md for this web project:
+
+Project name: {name}
+Description: {description}
+Technologies: {tech_list}
+{feature_info}
+
+Include:
+- Project title and description
+- Features list
+- Prerequisites and installation instructions
+- Usage instructions
+- Project structure
+- Contributing guidelines
+- License section (MIT)
+
+Make it clear, well-formatted, and professional."""
+
+# Prompt for generate_documentation, filled in on each call
+_DOCUMENTATION_PROMPT_TEMPLATE = """Generate {doc_type} documentation for the following:
+
+{code}
+
+Create clear, well-structured documentation that includes:
+- Overview/introduction
+- Main sections based on the content
+- Examples where appropriate
+- Any important notes or warnings
+
+Format as Markdown."""
+
+# Prompt for research_topic, filled in on each call
+_RESEARCH_PROMPT_TEMPLATE = """Research and summarize best practices for: {topic}
+
+Provide:
+1. Brief summary (2-3 sentences)
+2. Key best practices (bullet points)
+3. Common pitfalls to avoid
+4. Recommended resources or approaches
+
+Be concise and practical."""
+
+# Prompt for format_code, filled in on each call
+_FORMAT_PROMPT_TEMPLATE = """Format the following {language} code according to best \
+practices and standards:
+
+```{language}
+{code}
+```
+
+Return only the formatted code, no explanations."""
+
+# Prompt for create_gitignore, filled in on each call
+_GITIGNORE_PROMPT_TEMPLATE = """Create a comprehensive .gitignore file for a \
+{project_type} project.
+
+Include common patterns for:
+- Dependencies
+- Build outputs
+- IDE/editor files
+- OS-specific files
+- Environment files
+- Logs
+
+Return only the gitignore content, no explanations."""
+
+# README sections used when the AI is unavailable, after the title and
+# description
+_README_FALLBACK_BODY = """## Features
+
+- Modern, responsive design
+- Clean and maintainable code
+- Cross-browser compatible
+
+## Getting Started
+
+### Prerequisites
+
+- A modern web browser
+- (Optional) A local web server for development
+
+### Installation
+
+1. Clone the repository
+2. Open `index.html` in your browser
+
+## Usage
+
+Open the project in your browser to view the website.
+
+## Project Structure
+
+```
+project/
+├── index.html
+├── css/
+│   └── styles.css
+├── js/
+│   └── script.js
+└── README.md
+```
+
+## Contributing
+
+1. Fork the repository
+2. Create a feature branch
+3. Commit your changes
+4. Push to the branch
+5. Open a Pull Request
+
+## License
+
+MIT License - see LICENSE file for details
+"""
+
+# Documentation used when the AI is unavailable, showing the start of the
+# content it was asked to document
+_DOCUMENTATION_FALLBACK_TEMPLATE = """# {title} Documentation
+
+## Overview
+
+Documentation for the provided code/content.
+
+## Details
+
+{details}...
+
+## Notes
+
+This documentation was auto-generated.
+"""
+
+# .gitignore used when the AI is unavailable
+_GITIGNORE_FALLBACK = """# Dependencies
+node_modules/
+__pycache__/
+venv/
+.venv/
+
+# Build outputs
+dist/
+build/
+*.min.js
+*.min.css
+
+# IDE/Editor
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# Environment
+.env
+.env.local
+.env.*.local
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Logs
+*.log
+npm-debug.log*
+
+# Cache
+.cache/
+.parcel-cache/
+"""
+
 
 class Helper(BaseAgent):
     """
@@ -30,6 +242,16 @@ class Helper(BaseAgent):
         >>> readme = await helper.generate_readme(project_info)
     """
 
+    # Number of research topics whose findings are kept
+    RESEARCH_CACHE_SIZE = 128
+
+    # Number of AI-written documents kept, by the prompt that produced them
+    DOCUMENT_CACHE_SIZE = 64
+
+    # Research requests counted before topic frequencies are halved, so
+    # topics that were popular long ago lose their weight
+    RESEARCH_FREQUENCY_SAMPLE = 1280
+
     def __init__(
         self,
         name: str = "Helper",
@@ -46,7 +268,14 @@ class Helper(BaseAgent):
         """
         super().__init__(name=name, model=model, message_bus=message_bus)
         self._generated_docs: dict[str, str] = {}
-        self._research_cache: dict[str, Any] = {}
+        # Cleaned AI documents by prompt, least recently used first
+        self._document_cache: OrderedDict[str, str] = OrderedDict()
+        # Research findings by case-folded topic, least recently used first
+        self._research_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # How often each case-folded topic was asked for, used to decide
+        # whether new findings may evict the least recently used ones
+        self._research_frequency: Counter[str] = Counter()
+        self._research_requests = 0
 
     async def process(self, message: Message) -> Message:
         """
@@ -58,10 +287,12 @@ class Helper(BaseAgent):
         Returns:
             Message: Response with task status.
         """
-        await self._set_busy(f"Helping with: {message.content[:50]}")
+        await self._set_busy("Helping with: %.50s", message.content)
 
         try:
-            # Analyze the request and determine task type
+            # Analyze the request and determine task type. One lowered copy and
+            # plain substring checks; checked in priority order, so "document
+            # the readme" is a README request
             content = message.content.lower()
 
             if "readme" in content:
@@ -102,7 +333,7 @@ class Helper(BaseAgent):
             to_agent=message.from_agent,
             content=response_content,
             message_type="response",
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
     async def send_message(
@@ -131,7 +362,7 @@ class Helper(BaseAgent):
             to_agent=to_agent,
             content=content,
             message_type=message_type,
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
         )
 
         await self._log_activity("Sending message", f"To: {to_agent}")
@@ -149,6 +380,31 @@ class Helper(BaseAgent):
             f"From: {message.from_agent}",
         )
 
+    async def _generate_document(self, prompt: str, language: str) -> str:
+        """
+        Ask the AI for a document, reusing the answer to an identical prompt.
+
+        Args:
+            prompt: The prompt describing the document.
+            language: Language of the fenced block the AI may wrap it in.
+
+        Returns:
+            str: The document without markdown code fences.
+        """
+        document = self._document_cache.get(prompt)
+        if document is not None:
+            self._document_cache.move_to_end(prompt)
+            return document
+
+        response = await self.get_ai_response(prompt)
+        document = self._clean_code_response(response, language)
+        # Empty answers are not kept, so the next request asks again
+        if document:
+            self._document_cache[prompt] = document
+            if len(self._document_cache) > self.DOCUMENT_CACHE_SIZE:
+                self._document_cache.popitem(last=False)
+        return document
+
     async def generate_readme(self, project_info: dict[str, Any]) -> str:
         """
         Generate a README.md file for a project.
@@ -178,28 +434,14 @@ class Helper(BaseAgent):
                     for f in features
                 )
 
-            prompt = f"""Create a professional README.md for this web project:
-
-Project name: {name}
-Description: {description}
-Technologies: {tech_list}
-{feature_info}
-
-Include:
-- Project title and description
-- Features list
-- Prerequisites and installation instructions
-- Usage instructions
-- Project structure
-- Contributing guidelines
-- License section (MIT)
-
-Make it clear, well-formatted, and professional."""
-
-            readme = await self.get_ai_response(prompt)
+            prompt = _README_PROMPT_TEMPLATE.format(
+                name=name,
+                description=description,
+                tech_list=tech_list,
+                feature_info=feature_info,
+            )
 
-            # Clean up any markdown code blocks
-            readme = self._clean_code_response(readme, "markdown")
+            readme = await self._generate_document(prompt, "markdown")
 
             self._generated_docs["README.md"] = readme
 
@@ -208,56 +450,7 @@ Make it clear, well-formatted, and professional."""
             name = project_info.get("name", "Project")
             description = project_info.get("description", "A new project.")
 
-            readme = f"""# {name}
-
-{description}
-
-## Features
-
-- Modern, responsive design
-- Clean and maintainable code
-- Cross-browser compatible
-
-## Getting Started
-
-### Prerequisites
-
-- A modern web browser
-- (Optional) A local web server for development
-
-### Installation
-
-1. Clone the repository
-2. Open `index.html` in your browser
-
-## Usage
-
-Open the project in your browser to view the website.
-
-## Project Structure
-
-```
-project/
-├── index.html
-├── css/
-│   └── styles.css
-├── js/
-│   └── script.js
-└── README.md
-```
-
-## Contributing
-
-1. Fork the repository
-2. Create a feature branch
-3. Commit your changes
-4. Push to the branch
-5. Open a Pull Request
-
-## License
-
-MIT License - see LICENSE file for details
-"""
+            readme = f"# {name}\n\n{description}\n\n{_README_FALLBACK_BODY}"
             self._generated_docs["README.md"] = readme
 
         await self._set_idle()
@@ -278,44 +471,20 @@ MIT License - see LICENSE file for details
         Returns:
             str: Generated documentation.
         """
-        await self._set_busy(f"Generating {doc_type} documentation")
+        await self._set_busy("Generating %s documentation", doc_type)
 
         try:
-            prompt = f"""Generate {doc_type} documentation for the following:
+            prompt = _DOCUMENTATION_PROMPT_TEMPLATE.format(doc_type=doc_type, code=code)
 
-{code}
-
-Create clear, well-structured documentation that includes:
-- Overview/introduction
-- Main sections based on the content
-- Examples where appropriate
-- Any important notes or warnings
-
-Format as Markdown."""
-
-            docs = await self.get_ai_response(prompt)
-
-            # Clean up
-            docs = self._clean_code_response(docs, "markdown")
+            docs = await self._generate_document(prompt, "markdown")
 
             self._generated_docs[f"{doc_type}_docs.md"] = docs
 
         except Exception as e:
             self.logger.error(f"Documentation generation failed: {e}")
-            docs = f"""# {doc_type.upper()} Documentation
-
-## Overview
-
-Documentation for the provided code/content.
-
-## Details
-
-{code[:500]}...
-
-## Notes
-
-This documentation was auto-generated.
-"""
+            docs = _DOCUMENTATION_FALLBACK_TEMPLATE.format(
+                title=doc_type.upper(), details=code[:500]
+            )
             self._generated_docs[f"{doc_type}_docs.md"] = docs
 
         await self._set_idle()
@@ -336,22 +505,20 @@ This documentation was auto-generated.
         Returns:
             Dict mapping original paths to new paths.
         """
+        if not file_list:
+            return {}
+
         await self._set_busy("Organizing files")
 
         mappings: dict[str, str] = {}
 
-        # Simple organization based on file extensions
+        # Simple organization based on file extensions; HTML and unknown
+        # files keep their path
         for file_path in file_list:
-            ext = file_path.split(".")[-1].lower() if "." in file_path else ""
-
-            if ext in ["html", "htm"]:
-                mappings[file_path] = file_path  # Keep in root
-            elif ext == "css":
-                mappings[file_path] = f"css/{file_path.split('/')[-1]}"
-            elif ext in ["js", "jsx", "ts", "tsx"]:
-                mappings[file_path] = f"js/{file_path.split('/')[-1]}"
-            elif ext in ["png", "jpg", "jpeg", "gif", "svg", "webp"]:
-                mappings[file_path] = f"assets/images/{file_path.split('/')[-1]}"
+            _, dot, ext = file_path.rpartition(".")
+            folder = _EXTENSION_FOLDERS.get(ext.lower()) if dot else None
+            if folder:
+                mappings[file_path] = folder + file_path.rpartition("/")[2]
             else:
                 mappings[file_path] = file_path
 
@@ -368,23 +535,19 @@ This documentation was auto-generated.
         Returns:
             Dict with research findings.
         """
-        await self._set_busy(f"Researching: {topic}")
+        # Check cache first; "REST API" and "rest api" are the same topic.
+        # A hit does no work, so it skips the busy/idle round trip.
+        key = topic.casefold()
+        self._count_research_request(key)
+        cached = self._research_cache.get(key)
+        if cached is not None:
+            self._research_cache.move_to_end(key)
+            return cached
 
-        # Check cache first
-        if topic in self._research_cache:
-            await self._set_idle()
-            return self._research_cache[topic]
+        await self._set_busy("Researching: %s", topic)
 
         try:
-            prompt = f"""Research and summarize best practices for: {topic}
-
-Provide:
-1. Brief summary (2-3 sentences)
-2. Key best practices (bullet points)
-3. Common pitfalls to avoid
-4. Recommended resources or approaches
-
-Be concise and practical."""
+            prompt = _RESEARCH_PROMPT_TEMPLATE.format(topic=topic)
 
             response = await self.get_ai_response(prompt)
 
@@ -396,7 +559,10 @@ Be concise and practical."""
                 "resources": [],
             }
 
-            self._research_cache[topic] = findings
+            if self._admit_research(key):
+                self._research_cache[key] = findings
+                if len(self._research_cache) > self.RESEARCH_CACHE_SIZE:
+                    self._research_cache.popitem(last=False)
 
         except Exception as e:
             self.logger.error(f"Research failed: {e}")
@@ -412,6 +578,49 @@ Be concise and practical."""
         await self._set_idle()
         return findings
 
+    def _count_research_request(self, key: str) -> None:
+        """
+        Count a research request for the cache admission policy.
+
+        Every RESEARCH_FREQUENCY_SAMPLE requests all counts are halved and
+        topics that drop to zero are forgotten, so the counter stays small.
+
+        Args:
+            key: The case-folded topic.
+        """
+        self._research_frequency[key] += 1
+        self._research_requests += 1
+        if self._research_requests >= self.RESEARCH_FREQUENCY_SAMPLE:
+            self._research_frequency = Counter(
+                {
+                    topic: count // 2
+                    for topic, count in self._research_frequency.items()
+                    if count > 1
+                }
+            )
+            self._research_requests //= 2
+
+    def _admit_research(self, key: str) -> bool:
+        """
+        Decide whether new findings may enter the research cache.
+
+        While the cache has room everything is admitted. Once it is full,
+        a topic only replaces the least recently used one if it has been
+        asked for more often, so a run of one-off topics cannot flush out
+        the topics that keep coming back.
+
+        Args:
+            key: The case-folded topic.
+
+        Returns:
+            bool: True if the findings should be cached.
+        """
+        if len(self._research_cache) < self.RESEARCH_CACHE_SIZE:
+            return True
+        victim = next(iter(self._research_cache))
+        frequency = self._research_frequency
+        return frequency[key] > frequency[victim]
+
     async def format_code(self, code: str, language: str) -> str:
         """
         Format code according to language standards.
@@ -423,16 +632,10 @@ Be concise and practical."""
         Returns:
             str: Formatted code.
         """
-        await self._set_busy(f"Formatting {language} code")
+        await self._set_busy("Formatting %s code", language)
 
         try:
-            prompt = f"""Format the following {language} code according to best practices and standards:
-
-```{language}
-{code}
-```
-
-Return only the formatted code, no explanations."""
+            prompt = _FORMAT_PROMPT_TEMPLATE.format(language=language, code=code)
 
             formatted = await self.get_ai_response(prompt)
 
@@ -457,65 +660,18 @@ Return only the formatted code, no explanations."""
         Returns:
             str: Generated .gitignore content.
         """
-        await self._set_busy(f"Creating .gitignore for {project_type}")
+        await self._set_busy("Creating .gitignore for %s", project_type)
 
         try:
-            prompt = f"""Create a comprehensive .gitignore file for a {project_type} project.
+            prompt = _GITIGNORE_PROMPT_TEMPLATE.format(project_type=project_type)
 
-Include common patterns for:
-- Dependencies
-- Build outputs
-- IDE/editor files
-- OS-specific files
-- Environment files
-- Logs
-
-Return only the gitignore content, no explanations."""
-
-            gitignore = await self.get_ai_response(prompt)
-
-            # Clean up
-            gitignore = self._clean_code_response(gitignore, "gitignore")
+            gitignore = await self._generate_document(prompt, "gitignore")
 
             self._generated_docs[".gitignore"] = gitignore
 
         except Exception as e:
             self.logger.error(f"gitignore creation failed: {e}")
-            gitignore = """# Dependencies
-node_modules/
-__pycache__/
-venv/
-.venv/
-
-# Build outputs
-dist/
-build/
-*.min.js
-*.min.css
-
-# IDE/Editor
-.vscode/
-.idea/
-*.swp
-*.swo
-
-# Environment
-.env
-.env.local
-.env.*.local
-
-# OS
-.DS_Store
-Thumbs.db
-
-# Logs
-*.log
-npm-debug.log*
-
-# Cache
-.cache/
-.parcel-cache/
-"""
+            gitignore = _GITIGNORE_FALLBACK
             self._generated_docs[".gitignore"] = gitignore
 
         await self._set_idle()
@@ -537,38 +693,31 @@ npm-debug.log*
         description = project_info.get("description", "A web project")
         version = project_info.get("version", "1.0.0")
 
-        package_json = f'''{{
-  "name": "{name}",
-  "version": "{version}",
-  "description": "{description}",
-  "main": "index.js",
-  "scripts": {{
-    "start": "http-server . -p 3000",
-    "dev": "http-server . -p 3000 -c-1",
-    "test": "echo \\"No tests specified\\" && exit 0"
-  }},
-  "keywords": [],
-  "author": "",
-  "license": "MIT",
-  "devDependencies": {{
-    "http-server": "^14.1.1"
-  }}
-}}'''
+        # Encode each field, so quotes in them still give valid JSON
+        package_json = (
+            f'{{\n  "name": {_encode_json_value(name)},\n'
+            f'  "version": {_encode_json_value(version)},\n'
+            f'  "description": {_encode_json_value(description)},'
+            f"{_PACKAGE_JSON_TAIL}"
+        )
 
         self._generated_docs["package.json"] = package_json
         await self._set_idle()
         return package_json
 
-    async def get_generated_docs(self) -> dict[str, str]:
+    async def get_generated_docs(self) -> Mapping[str, str]:
         """
-        Get all generated documentation.
+        Get a read-only view of all generated documentation.
 
         Returns:
-            Dict mapping filenames to content.
+            Mapping of filenames to content.
         """
-        return self._generated_docs.copy()
+        return MappingProxyType(self._generated_docs)
 
     def clear_generated_docs(self) -> None:
         """Clear all generated documentation."""
-        self._generated_docs = {}
-        self._research_cache = {}
+        self._generated_docs.clear()
+        self._document_cache.clear()
+        self._research_cache.clear()
+        self._research_frequency.clear()
+        self._research_requests = 0
@@ -87,7 +87,7 @@ class Intermediator(BaseAgent):
         Returns:
             Message: Response message for the sender.
         """
-        await self._set_busy(f"Processing message from {message.from_agent}")
+        await self._set_busy("Processing message from %s", message.from_agent)
 
         try:
             # Build prompt with context
@@ -61,7 +61,7 @@ class OptimizerAgent(BaseAgent):
         Returns:
             Message: Response with optimization results.
         """
-        await self._set_busy(f"Optimizing: {message.content[:50]}")
+        await self._set_busy("Optimizing: %.50s", message.content)
 
         try:
             content_lower = message.content.lower()
@@ -74,7 +74,7 @@ class Orchestrator(BaseAgent):
         Returns:
             Message: Response message with coordination status.
         """
-        await self._set_busy(f"Processing request from {message.from_agent}")
+        await self._set_busy("Processing request from %s", message.from_agent)
 
         # TODO: Implement AI-powered task analysis and planning
         # 1. Analyze the request content
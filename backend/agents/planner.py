@@ -60,7 +60,7 @@ class Planner(BaseAgent):
         Returns:
             Message: Response with planning status or specifications.
         """
-        await self._set_busy(f"Planning: {message.content[:50]}")
+        await self._set_busy("Planning: %.50s", message.content)
 
         try:
             # Create specification from requirements
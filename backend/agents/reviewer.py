@@ -85,7 +85,7 @@ class Reviewer(BaseAgent):
         Returns:
             Message: Response with review findings.
         """
-        await self._set_busy(f"Reviewing: {message.content[:50]}")
+        await self._set_busy("Reviewing: %.50s", message.content)
 
         # TODO: Implement AI-powered code review
         # 1. Parse the code
@@ -170,7 +170,7 @@ class Reviewer(BaseAgent):
         Returns:
             List of review findings.
         """
-        await self._set_busy(f"Reviewing {file_path}")
+        await self._set_busy("Reviewing %s", file_path)
 
         # TODO: Implement AI-powered code review
         # For now, return empty findings
@@ -197,7 +197,7 @@ class Reviewer(BaseAgent):
         Returns:
             List of security-related findings.
         """
-        await self._set_busy(f"Security check: {file_path}")
+        await self._set_busy("Security check: %s", file_path)
 
         # TODO: Implement AI-powered security checking
         # Check for:
@@ -226,7 +226,7 @@ class Reviewer(BaseAgent):
         Returns:
             List of best practice findings.
         """
-        await self._set_busy(f"Best practices check: {file_path}")
+        await self._set_busy("Best practices check: %s", file_path)
 
         # TODO: Implement best practices checking
         findings: list[ReviewFinding] = []
@@ -145,7 +145,7 @@ class SecurityAgent(BaseAgent):
         Returns:
             Message: Response with security findings.
         """
-        await self._set_busy(f"Security review: {message.content[:50]}")
+        await self._set_busy("Security review: %.50s", message.content)
 
         try:
             # Perform security review
@@ -238,7 +238,7 @@ class SecurityAgent(BaseAgent):
         Returns:
             list: List of security findings.
         """
-        await self._set_busy(f"Reviewing {file_path}")
+        await self._set_busy("Reviewing %s", file_path)
 
         findings: list[SecurityFinding] = []
 
@@ -93,7 +93,7 @@ class Tester(BaseAgent):
         Returns:
             Message: Response with test status.
         """
-        await self._set_busy(f"Testing: {message.content[:50]}")
+        await self._set_busy("Testing: %.50s", message.content)
 
         # TODO: Implement AI-powered testing
         # 1. Analyze code to test
@@ -175,7 +175,7 @@ class Tester(BaseAgent):
         Returns:
             str: Generated test code.
         """
-        await self._set_busy(f"Generating tests for {file_path}")
+        await self._set_busy("Generating tests for %s", file_path)
 
         # TODO: Implement AI-powered test generation
         test_code = f"""
@@ -203,7 +203,7 @@ def test_placeholder():
         Returns:
             List of test results.
         """
-        await self._set_busy(f"Running tests: {test_path}")
+        await self._set_busy("Running tests: %s", test_path)
 
         # TODO: Implement test execution
         results: list[TestResult] = []
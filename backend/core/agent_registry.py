@@ -10,7 +10,7 @@ import logging
 import threading
 from datetime import datetime, timedelta
 
-from backend.models.messages import AgentInfo, AgentStatusType
+from backend.models.messages import AgentInfo, AgentState
 
 
 class AgentRegistry:
@@ -29,7 +29,7 @@ class AgentRegistry:
         >>> registry = AgentRegistry()
         >>> registry.register("frontend_agent", capabilities=["html", "css", "js"])
         >>> available = registry.get_available_agents("html")
-        >>> registry.update_status("frontend_agent", AgentStatusType.BUSY)
+        >>> registry.update_status("frontend_agent", AgentState.BUSY)
     """
 
     def __init__(
@@ -58,7 +58,7 @@ class AgentRegistry:
         self,
         name: str,
         capabilities: list[str] | None = None,
-        status: AgentStatusType = AgentStatusType.IDLE,
+        status: AgentState = AgentState.IDLE,
     ) -> AgentInfo:
         """
         Register an agent.
@@ -145,7 +145,7 @@ class AgentRegistry:
     def update_status(
         self,
         name: str,
-        status: AgentStatusType,
+        status: AgentState,
         current_task_id: str | None = None,
     ) -> bool:
         """
@@ -194,8 +194,8 @@ class AgentRegistry:
             agent.last_heartbeat = datetime.utcnow()
 
             # Bring back online if was offline
-            if agent.status == AgentStatusType.OFFLINE:
-                agent.status = AgentStatusType.IDLE
+            if agent.status == AgentState.OFFLINE:
+                agent.status = AgentState.IDLE
                 self.logger.info(f"Agent '{name}' is back online")
 
             return True
@@ -228,10 +228,10 @@ class AgentRegistry:
 
             return [
                 a for a in agents
-                if a.status in (AgentStatusType.IDLE, AgentStatusType.WAITING)
+                if a.status in (AgentState.IDLE, AgentState.WAITING)
             ]
 
-    def get_agents_by_status(self, status: AgentStatusType) -> list[AgentInfo]:
+    def get_agents_by_status(self, status: AgentState) -> list[AgentInfo]:
         """
         Get agents by status.
 
@@ -352,10 +352,10 @@ class AgentRegistry:
             if not agent:
                 return False
 
-            if agent.status == AgentStatusType.ERROR:
+            if agent.status == AgentState.ERROR:
                 return False
 
-            if agent.status == AgentStatusType.OFFLINE:
+            if agent.status == AgentState.OFFLINE:
                 return False
 
             elapsed = (datetime.utcnow() - agent.last_heartbeat).total_seconds()
@@ -410,10 +410,10 @@ class AgentRegistry:
 
         for agent in self._agents.values():
             if (
-                agent.status != AgentStatusType.OFFLINE
+                agent.status != AgentState.OFFLINE
                 and agent.last_heartbeat < cutoff
             ):
-                agent.status = AgentStatusType.OFFLINE
+                agent.status = AgentState.OFFLINE
                 agent.current_task_id = None
                 count += 1
                 self.logger.warning(f"Agent '{agent.name}' marked as offline")
@@ -8,9 +8,10 @@ to receive messages from other agents.
 
 import asyncio
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable, Coroutine
 from datetime import datetime
+from itertools import islice
 from typing import Any
 from uuid import uuid4
 
@@ -63,7 +64,7 @@ class MessageBus:
     Attributes:
         subscriptions: Dictionary mapping topics to subscriptions.
         message_queue: Async queue for message processing.
-        message_history: List of recent messages for debugging.
+        message_history: Bounded buffer of recent messages for debugging.
 
     Example:
         >>> bus = MessageBus()
@@ -81,7 +82,8 @@ class MessageBus:
         self._subscriptions: dict[str, list[Subscription]] = defaultdict(list)
         self._agent_subscriptions: dict[str, set[str]] = defaultdict(set)
         self._message_queue: asyncio.Queue[Message] = asyncio.Queue()
-        self._message_history: list[Message] = []
+        # Oldest messages fall off the front once max_history is reached
+        self._message_history: deque[Message] = deque(maxlen=max_history)
         self._max_history = max_history
         self._running = False
         self._processor_task: asyncio.Task | None = None
@@ -198,8 +200,6 @@ class MessageBus:
         """
         # Add to history
         self._message_history.append(message)
-        if len(self._message_history) > self._max_history:
-            self._message_history.pop(0)
 
         # Get subscribers for this topic
         subscribers = self._subscriptions.get(topic, [])
@@ -308,7 +308,10 @@ class MessageBus:
         Returns:
             List of recent messages.
         """
-        messages = self._message_history[-limit:]
+        history = self._message_history
+        # Deques can't be sliced; skip straight to the last `limit` entries
+        start = max(len(history) - limit, 0) if limit else 0
+        messages = list(islice(history, start, None))
         if topic:
             # Filter by topic would require storing topic with message
             # For now, return all messages
@@ -5,8 +5,11 @@ This module serves as the primary entry point for the AgentForge Studio
 application. It initializes the API server and starts all necessary services.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import NoReturn
 
 import uvicorn
@@ -14,12 +17,18 @@ import uvicorn
 from backend.api.server import create_app
 from backend.core.config import get_settings
 
-# Configure logging
+# Configure logging. Records are formatted by the QueueHandler and written to
+# stdout by a background listener thread, so agents logging activity never
+# block on the stream handler's lock or on stdout I/O.
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
+    handlers=[QueueHandler(_log_queue)],
 )
+_log_listener = QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +19,7 @@ from backend.models.memory import (
 )
 from backend.models.messages import (
     AgentInfo,
+    AgentState,
     AgentStatusType,
     ErrorMessage,
     Event,
@@ -70,6 +71,7 @@ __all__ = [
     "MessageType",
     "TaskPriority",
     "TaskState",
+    "AgentState",
     "AgentStatusType",
     "EventType",
     "BusMessage",
@@ -5,6 +5,9 @@ This module defines Pydantic models for inter-agent communication,
 including messages, tasks, events, and status updates.
 """
 
+import itertools
+import os
+import secrets
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -12,6 +15,29 @@ from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
+# Message IDs are a random per-process prefix plus a counter, which keeps
+# them unique across processes without building a UUID for every message
+_MESSAGE_ID_PREFIX = secrets.token_hex(4)
+_message_id_counter = itertools.count()
+
+
+def _reseed_message_ids() -> None:
+    """Give a forked child its own message ID prefix and counter."""
+    global _MESSAGE_ID_PREFIX, _message_id_counter
+    _MESSAGE_ID_PREFIX = secrets.token_hex(4)
+    _message_id_counter = itertools.count()
+
+
+# A forked child inherits the parent's prefix and counter, so it would
+# otherwise hand out the same IDs as the parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_message_ids)
+
+
+def _next_message_id() -> str:
+    """Return a new message ID unique across processes."""
+    return f"{_MESSAGE_ID_PREFIX}{next(_message_id_counter):016x}"
+
 
 class MessageType(str, Enum):
     """Types of messages exchanged between agents."""
@@ -42,14 +68,18 @@ class TaskState(str, Enum):
     BLOCKED = "BLOCKED"
 
 
-class AgentStatusType(str, Enum):
-    """Status types for agents."""
+class AgentState(str, Enum):
+    """Enumeration of possible agent states."""
 
-    IDLE = "IDLE"
-    BUSY = "BUSY"
-    WAITING = "WAITING"
-    ERROR = "ERROR"
-    OFFLINE = "OFFLINE"
+    IDLE = "idle"
+    BUSY = "busy"
+    WAITING = "waiting"
+    ERROR = "error"
+    OFFLINE = "offline"
+
+
+# Former name of AgentState, kept for existing imports
+AgentStatusType = AgentState
 
 
 class EventType(str, Enum):
@@ -78,7 +108,7 @@ class Message(BaseModel):
         priority: Message priority level.
     """
 
-    id: str = Field(default_factory=lambda: str(uuid4()), description="Message ID")
+    id: str = Field(default_factory=_next_message_id, description="Message ID")
     from_agent: str = Field(..., description="Name of the sending agent")
     to_agent: str | None = Field(
         default=None, description="Name of the receiving agent"
@@ -175,7 +205,7 @@ class StatusMessage(Message):
     """
 
     agent_name: str = Field(..., description="Name of the agent")
-    status: AgentStatusType = Field(..., description="Current agent status")
+    status: AgentState = Field(..., description="Current agent status")
     current_task: str | None = Field(
         default=None, description="Current task description"
     )
@@ -332,8 +362,8 @@ class AgentInfo(BaseModel):
     """
 
     name: str = Field(..., description="Agent name")
-    status: AgentStatusType = Field(
-        default=AgentStatusType.IDLE, description="Current status"
+    status: AgentState = Field(
+        default=AgentState.IDLE, description="Current status"
     )
     capabilities: list[str] = Field(
         default_factory=list, description="Agent capabilities"
@@ -353,7 +383,7 @@ class AgentInfo(BaseModel):
         "json_schema_extra": {
             "example": {
                 "name": "frontend_agent",
-                "status": "IDLE",
+                "status": "idle",
                 "capabilities": ["html", "css", "js"],
             }
         },
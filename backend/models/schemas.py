@@ -267,6 +267,9 @@ class AgentStatus(BaseModel):
     class Config:
         """Pydantic configuration."""
 
+        # Agents hand the same instance to every caller until their state
+        # changes, so it must not be edited in place
+        frozen = True
         json_schema_extra = {
             "example": {
                 "name": "FrontendAgent",
@@ -8,13 +8,14 @@ using mocks to avoid actual AI API calls during testing.
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from pydantic import ValidationError
 
-from backend.agents.base_agent import AgentState, get_provider_manager
+from backend.agents.base_agent import AgentState, BaseAgent, get_provider_manager
 from backend.agents.frontend_agent import FrontendAgent
 from backend.agents.helper import Helper
 from backend.agents.intermediator import Intermediator
 from backend.agents.planner import Planner
-from backend.models.schemas import ChatMessage
+from backend.models.schemas import ChatMessage, Message
 
 
 class TestBaseAgent:
@@ -22,9 +23,7 @@ class TestBaseAgent:
 
     def test_get_provider_manager_singleton(self):
         """Test that provider manager is a singleton."""
-        import backend.agents.base_agent as base_agent_module
-
-        base_agent_module._provider_manager = None
+        get_provider_manager.cache_clear()
 
         settings_path = "backend.core.ai_clients.provider_manager.get_settings"
         with patch(settings_path) as mock_settings:
@@ -36,6 +35,171 @@ class TestBaseAgent:
             manager2 = get_provider_manager()
             assert manager1 is manager2
 
+    def test_abstract_methods_required(self):
+        """Test a subclass missing an abstract method cannot be created."""
+
+        class PartialAgent(BaseAgent):
+            async def process(self, message):
+                return message
+
+        assert BaseAgent.__abstractmethods__ == {
+            "process",
+            "send_message",
+            "receive_message",
+        }
+        with pytest.raises(TypeError):
+            PartialAgent(name="Partial")
+
+    def test_clean_code_response(self):
+        """Test markdown fences are stripped from AI code responses."""
+        clean = Helper._clean_code_response
+        assert clean("```python\nprint(1)\n```") == "print(1)"
+        assert clean("  ```html\n<p>x</p>\n```  ", "html") == "<p>x</p>"
+        assert clean("```json\n{}\n```", "json") == "{}"
+        assert clean("```x = 1```") == "x = 1"
+        assert clean("plain code") == "plain code"
+        assert clean("```markdown\n# Title\nBody", "markdown") == "# Title\nBody"
+        assert clean("```") == ""
+        assert clean("``````") == ""
+
+    def test_find_fences(self):
+        """Test fence offsets point at the code inside the response."""
+        from backend.agents.base_agent import _find_fences
+
+        text = "```python\nprint(1)\n```"
+        start, end = _find_fences(text)
+        assert text[start:end] == "print(1)\n"
+        assert _find_fences("plain code") == (0, 10)
+
+    @pytest.mark.asyncio
+    async def test_get_status_cached_until_state_changes(self):
+        """Test the status snapshot is reused until the state changes."""
+        agent = Helper()
+        status = agent.get_status()
+        assert agent.get_status() is status
+
+        await agent._set_busy("Working")
+        busy = agent.get_status()
+        assert busy is not status
+        assert busy.status == "busy"
+        assert busy.current_task == "Working"
+
+        await agent._set_error("boom")
+        assert agent.get_status().status == "error"
+        assert type(agent.get_status().status) is str
+        assert "status='error'" in repr(agent)
+
+        agent.status = AgentState.IDLE
+        assert agent.get_status().status == "idle"
+
+    @pytest.mark.asyncio
+    async def test_get_status_fast_matches_get_status(self):
+        """Test the status snapshot carries the same data as the model."""
+        import json
+
+        agent = Helper()
+        await agent._set_busy("Processing: %s", "docs")
+        snapshot = agent.get_status_fast()
+        assert snapshot.status == AgentState.BUSY
+        assert snapshot._asdict() == agent.get_status().model_dump()
+        assert json.loads(json.dumps(snapshot._asdict())) == json.loads(
+            agent.get_status().model_dump_json()
+        )
+
+    def test_created_at(self):
+        """Test the creation time is reported as an aware UTC datetime."""
+        from datetime import datetime, timedelta, timezone
+
+        agent = Helper()
+        age = datetime.now(timezone.utc) - agent.created_at
+        assert agent.created_at.tzinfo is timezone.utc
+        assert timedelta(0) <= age < timedelta(seconds=5)
+
+    def test_system_prompt_read_once(self):
+        """Test agents with the same role share one prompt file read."""
+        from backend.agents.base_agent import _read_prompt
+
+        _read_prompt.cache_clear()
+        first = Helper()
+        second = Helper()
+        assert first.system_prompt is not None
+        assert second.system_prompt is first.system_prompt
+        assert _read_prompt.cache_info().misses == 1
+
+    def test_prompts_dir_override(self, tmp_path):
+        """Test a subclass can load prompts from its own directory."""
+        (tmp_path / "helper_prompt.txt").write_text("Custom prompt", encoding="utf-8")
+
+        class CustomHelper(Helper):
+            PROMPTS_DIR = tmp_path
+
+        assert CustomHelper().system_prompt == "Custom prompt"
+        assert Helper().system_prompt != "Custom prompt"
+
+    @pytest.mark.asyncio
+    async def test_set_busy_formats_task_lazily(self):
+        """Test busy task descriptions are formatted when first read."""
+        agent = Helper()
+        await agent._set_busy("Processing: %.5s", "abcdefgh")
+        assert agent.current_task == "Processing: abcde"
+        assert agent.get_status().current_task == "Processing: abcde"
+
+        await agent._set_busy("Done 100%")
+        assert agent.current_task == "Done 100%"
+
+        await agent._set_idle()
+        assert agent.current_task is None
+        assert agent.status == AgentState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_shared_status_cannot_be_edited(self):
+        """Test the shared status snapshot rejects in-place edits."""
+        agent = Helper()
+        await agent._set_busy("Working")
+        with pytest.raises(ValidationError):
+            agent.get_status().current_task = "changed"
+        assert agent.get_status().current_task == "Working"
+
+    @pytest.mark.asyncio
+    async def test_set_idle_when_already_idle(self):
+        """Test releasing an idle agent keeps its status and logs nothing."""
+        agent = Helper()
+        status = agent.get_status()
+
+        with patch.object(
+            agent, "_log_activity", new_callable=AsyncMock
+        ) as mock_log:
+            await agent._set_idle()
+            mock_log.assert_not_awaited()
+        assert agent.get_status() is status
+
+        await agent._set_error("boom")
+        await agent._set_idle()
+        assert agent.status == AgentState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_get_ai_response_forwards_options(self):
+        """Test generation options are passed through only when given."""
+        agent = Helper()
+        mock_manager = AsyncMock()
+        mock_manager.generate.return_value = ("response", "gemini")
+
+        with patch(
+            "backend.agents.base_agent.get_provider_manager",
+            return_value=mock_manager,
+        ):
+            assert await agent.get_ai_response("hi", "sys") == "response"
+            mock_manager.generate.assert_awaited_with(
+                prompt="hi", system_prompt="sys"
+            )
+
+            await agent.get_ai_response("hi", temperature=0.2)
+            mock_manager.generate.assert_awaited_with(
+                prompt="hi",
+                system_prompt=agent.system_prompt,
+                temperature=0.2,
+            )
+
 
 class TestIntermedator:
     """Tests for the Intermediator agent."""
@@ -220,6 +384,42 @@ class TestHelper:
         assert helper.name == "Helper"
         assert helper.status == AgentState.IDLE
 
+    @pytest.mark.asyncio
+    async def test_process_routes_by_keyword_priority(self):
+        """Test requests are routed to the first matching helper task."""
+        helper = Helper()
+
+        async def ask(content):
+            message = Message(from_agent="user", to_agent="helper", content=content)
+            return (await helper.process(message)).content
+
+        with patch.object(
+            helper, "get_ai_response", new_callable=AsyncMock
+        ) as mock_ai:
+            mock_ai.return_value = "general help"
+            assert (await ask("Document the README")).startswith("README")
+            assert (await ask("Write the docs")).startswith("Documentation")
+            assert (await ask("Add a .GITIGNORE")).startswith(".gitignore")
+            assert (await ask("Package it as JSON")).startswith("package.json")
+            assert await ask("Rename the project") == "general help"
+        assert helper.status == AgentState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_process_response_timestamp_is_utc(self):
+        """Test responses carry a timezone-aware UTC timestamp."""
+        from datetime import timezone
+
+        helper = Helper()
+        message = Message(from_agent="user", to_agent="helper", content="gitignore")
+
+        with patch.object(
+            helper, "get_ai_response", new_callable=AsyncMock
+        ) as mock_ai:
+            mock_ai.return_value = "node_modules/"
+            response = await helper.process(message)
+
+        assert response.timestamp.tzinfo is timezone.utc
+
     @pytest.mark.asyncio
     async def test_generate_readme_returns_string(self):
         """Test that generate_readme returns README string."""
@@ -248,6 +448,70 @@ class TestHelper:
 
         assert isinstance(gitignore, str)
 
+    @pytest.mark.asyncio
+    async def test_repeated_documents_reuse_ai_answer(self):
+        """Test identical document requests share one AI call."""
+        helper = Helper()
+
+        with patch.object(
+            helper, "get_ai_response", new_callable=AsyncMock
+        ) as mock_ai:
+            mock_ai.return_value = "```gitignore\nnode_modules/\n```"
+            first = await helper.create_gitignore("node")
+            helper._generated_docs.clear()
+            second = await helper.create_gitignore("node")
+            assert first == second == "node_modules/"
+            assert helper._generated_docs[".gitignore"] == second
+            assert mock_ai.await_count == 1
+
+            await helper.create_gitignore("python")
+            assert mock_ai.await_count == 2
+
+            helper.clear_generated_docs()
+            await helper.create_gitignore("node")
+            assert mock_ai.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_fallbacks_when_ai_fails(self):
+        """Test README, docs and .gitignore fall back to built-in templates."""
+        helper = Helper()
+
+        with patch.object(
+            helper, "get_ai_response", new_callable=AsyncMock
+        ) as mock_ai:
+            mock_ai.side_effect = RuntimeError("provider down")
+            readme = await helper.generate_readme(
+                {"name": "Demo", "description": "Uses {braces}"}
+            )
+            gitignore = await helper.create_gitignore("web")
+            docs = await helper.generate_documentation("x = {'a': 1}", "user")
+
+        assert docs.startswith("# USER Documentation\n")
+        assert "\nx = {'a': 1}...\n" in docs
+        assert readme.startswith("# Demo\n\nUses {braces}\n\n## Features\n")
+        assert readme.endswith("MIT License - see LICENSE file for details\n")
+        assert "node_modules/" in gitignore
+        assert helper._generated_docs["README.md"] == readme
+        assert helper._generated_docs[".gitignore"] == gitignore
+
+    @pytest.mark.asyncio
+    async def test_prompts_keep_braces_in_values(self):
+        """Test code with braces is passed to the AI prompt verbatim."""
+        helper = Helper()
+        code = "const config = { port: 3000 };"
+
+        with patch.object(
+            helper, "get_ai_response", new_callable=AsyncMock
+        ) as mock_ai:
+            mock_ai.return_value = code
+            await helper.format_code(code, "javascript")
+            prompt = mock_ai.await_args.args[0]
+
+        assert prompt.startswith(
+            "Format the following javascript code according to best practices"
+        )
+        assert f"```javascript\n{code}\n```" in prompt
+
     @pytest.mark.asyncio
     async def test_create_package_json_returns_valid_json(self):
         """Test that create_package_json returns valid JSON."""
@@ -261,6 +525,108 @@ class TestHelper:
         assert "name" in parsed
         assert parsed["name"] == "test-project"
 
+    @pytest.mark.asyncio
+    async def test_create_package_json_escapes_fields(self):
+        """Test quotes and backslashes in fields keep package.json valid."""
+        import json
+
+        helper = Helper()
+        description = 'A "quoted" C:\\path'
+        package_json = await helper.create_package_json(
+            {"name": "My App", "description": description}
+        )
+
+        parsed = json.loads(package_json)
+        assert parsed["name"] == "my-app"
+        assert parsed["description"] == description
+        assert parsed["scripts"]["test"] == 'echo "No tests specified" && exit 0'
+        assert helper._generated_docs["package.json"] == package_json
+
+    @pytest.mark.asyncio
+    async def test_organize_files_by_extension(self):
+        """Test files are moved into folders by their extension."""
+        helper = Helper()
+        files = [
+            "index.html",
+            "src/style.CSS",
+            "src/app.tsx",
+            "img/logo.PNG",
+            "css",
+            "dir.v2/LICENSE",
+        ]
+
+        mappings = await helper.organize_files(files, {})
+
+        assert mappings == {
+            "index.html": "index.html",
+            "src/style.CSS": "css/style.CSS",
+            "src/app.tsx": "js/app.tsx",
+            "img/logo.PNG": "assets/images/logo.PNG",
+            "css": "css",
+            "dir.v2/LICENSE": "dir.v2/LICENSE",
+        }
+        assert helper.status == AgentState.IDLE
+
+        with patch.object(helper, "_set_busy", new_callable=AsyncMock) as busy:
+            assert await helper.organize_files([], {}) == {}
+            busy.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_research_cache_is_bounded_and_case_insensitive(self):
+        """Test research findings are shared across case and evicted LRU."""
+        helper = Helper()
+        helper.RESEARCH_CACHE_SIZE = 2
+
+        with patch.object(
+            helper, "get_ai_response", new_callable=AsyncMock
+        ) as mock_ai:
+            mock_ai.return_value = "findings"
+            first = await helper.research_topic("REST API")
+            with patch.object(
+                helper, "_set_busy", new_callable=AsyncMock
+            ) as mock_busy:
+                assert await helper.research_topic("rest api") is first
+                mock_busy.assert_not_awaited()
+            assert mock_ai.await_count == 1
+
+            await helper.research_topic("GraphQL")
+            await helper.research_topic("REST API")
+            # A first request for a new topic cannot evict an equally
+            # popular one, a repeated request can
+            await helper.research_topic("gRPC")
+            assert list(helper._research_cache) == ["graphql", "rest api"]
+            await helper.research_topic("gRPC")
+            assert list(helper._research_cache) == ["rest api", "grpc"]
+
+            await helper.research_topic("graphql")
+            assert mock_ai.await_count == 5
+        assert helper.status == AgentState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_research_cache_resists_one_off_topics(self):
+        """Test a run of one-off topics does not flush popular ones."""
+        helper = Helper()
+        helper.RESEARCH_CACHE_SIZE = 2
+        helper.RESEARCH_FREQUENCY_SAMPLE = 20
+
+        with patch.object(
+            helper, "get_ai_response", new_callable=AsyncMock
+        ) as mock_ai:
+            mock_ai.return_value = "findings"
+            for topic in ["css grid", "flexbox", "css grid", "flexbox"]:
+                await helper.research_topic(topic)
+            for index in range(16):
+                await helper.research_topic(f"one-off {index}")
+            assert list(helper._research_cache) == ["css grid", "flexbox"]
+            assert mock_ai.await_count == 18
+
+        # Counts are halved every sample, so old one-offs are forgotten
+        assert helper._research_requests == 10
+        assert helper._research_frequency == {"css grid": 1, "flexbox": 1}
+
+        helper.clear_generated_docs()
+        assert not helper._research_frequency
+
     @pytest.mark.asyncio
     async def test_get_generated_docs(self):
         """Test getting generated docs."""
@@ -270,7 +636,14 @@ class TestHelper:
         docs = await helper.get_generated_docs()
 
         assert "README.md" in docs
-        assert docs is not helper._generated_docs  # Should be a copy
+        assert docs is not helper._generated_docs  # Should be a view
+        with pytest.raises(TypeError):
+            docs["README.md"] = "# Changed"
+
+        await helper.create_package_json({"name": "test"})
+        assert "package.json" in docs
+        helper.clear_generated_docs()
+        assert len(docs) == 0
 
     def test_clear_generated_docs(self):
         """Test clearing generated docs."""
@@ -294,3 +667,40 @@ class TestAgentState:
         assert AgentState.WAITING == "waiting"
         assert AgentState.ERROR == "error"
         assert AgentState.OFFLINE == "offline"
+
+    def test_shared_with_message_models(self):
+        """Test agents and bus message models use one state enum."""
+        from backend.models.messages import AgentStatusType, StatusMessage
+
+        assert AgentStatusType is AgentState
+        msg = StatusMessage(
+            from_agent="Helper", agent_name="Helper", status=AgentState.BUSY
+        )
+        assert msg.status == "busy"
+
+
+class TestAgentsPackage:
+    """Tests for the backend.agents package exports."""
+
+    def test_lazy_imports_cover_agent_modules(self):
+        """Test the lazy import table matches the agent modules on disk."""
+        import pkgutil
+
+        import backend.agents as agents
+
+        modules = {
+            f"{agents.__name__}.{info.name}"
+            for info in pkgutil.iter_modules(agents.__path__)
+        }
+        assert set(agents._LAZY_IMPORTS.values()) == modules
+        assert set(agents._LAZY_IMPORTS) == set(agents.__all__)
+
+    def test_lazy_imports_resolve(self):
+        """Test every exported name resolves to the class in its module."""
+        import importlib
+
+        import backend.agents as agents
+
+        for name, module_name in agents._LAZY_IMPORTS.items():
+            module = importlib.import_module(module_name)
+            assert getattr(agents, name) is getattr(module, name)
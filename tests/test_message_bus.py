@@ -7,6 +7,7 @@ emission, file locking, and agent registry.
 """
 
 import asyncio
+import os
 
 import pytest
 
@@ -54,6 +55,35 @@ class TestMessageModels:
         assert msg.id is not None
         assert msg.timestamp is not None
 
+    def test_message_ids_unique(self):
+        """Test each message gets a distinct ID from the same process prefix."""
+        ids = [
+            BusMessage(from_agent="planner", type=MessageType.TASK).id
+            for _ in range(100)
+        ]
+        assert len(set(ids)) == 100
+        assert len({message_id[:8] for message_id in ids}) == 1
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+    def test_message_ids_unique_after_fork(self):
+        """Test a forked child does not repeat the parent's message IDs."""
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                child_id = BusMessage(from_agent="child", type=MessageType.TASK).id
+                os.write(write_end, child_id.encode())
+            finally:
+                os._exit(0)
+        os.close(write_end)
+        parent_id = BusMessage(from_agent="parent", type=MessageType.TASK).id
+        with os.fdopen(read_end) as reader:
+            child_id = reader.read()
+        os.waitpid(pid, 0)
+        assert child_id
+        assert child_id != parent_id
+        assert child_id[:8] != parent_id[:8]
+
     def test_task_message_creation(self):
         """Test creating a task message."""
         msg = TaskMessage(
@@ -235,6 +265,28 @@ class TestMessageBus:
         history = bus.get_message_history(limit=3)
         assert len(history) == 3
 
+    @pytest.mark.asyncio
+    async def test_message_history_is_bounded(self):
+        """Test that history keeps only the most recent messages."""
+        bus = MessageBus(max_history=3)
+
+        for i in range(5):
+            msg = Message(
+                from_agent="sender",
+                to_agent="agent",
+                content=f"Message {i}",
+            )
+            await bus.publish("test", msg)
+
+        history = bus.get_message_history()
+        assert [m.content for m in history] == [
+            "Message 2",
+            "Message 3",
+            "Message 4",
+        ]
+        latest = bus.get_message_history(limit=2)
+        assert [m.content for m in latest] == ["Message 3", "Message 4"]
+
     @pytest.mark.asyncio
     async def test_get_topics(self):
         """Test getting all topics."""
@@ -10,6 +10,7 @@ import pytest
 from backend.agents.accessibility_agent import (
     AccessibilityAgent,
     AccessibilityIssue,
+    AccessibilitySeverity,
 )
 from backend.agents.analytics_agent import AnalyticsAgent
 from backend.agents.base_agent import AgentState
@@ -27,6 +28,7 @@ from backend.agents.security_agent import (
     SecurityFinding,
     SecuritySeverity,
 )
+from backend.models.schemas import Message
 
 
 class TestErrorHandlerAgent:
@@ -66,6 +68,131 @@ class TestErrorHandlerAgent:
         analysis = await handler.analyze_error("Connection refused")
         assert analysis.category == ErrorCategory.NETWORK
 
+    def test_categorize_error_priority(self):
+        """Test the highest-priority category wins when several match."""
+        handler = ErrorHandlerAgent()
+        categorize = handler._categorize_error
+        assert categorize("Connection timeout") == ErrorCategory.TIMEOUT
+        assert categorize("Invalid API key") == ErrorCategory.SYNTAX
+        assert categorize("TypeError: x is undefined") == ErrorCategory.RUNTIME
+        assert categorize("AssertionError") == ErrorCategory.LOGIC
+        assert categorize("KeyError: 'foo'") == ErrorCategory.UNKNOWN
+
+    @pytest.mark.asyncio
+    async def test_fix_suggestion_reused_for_same_error(self):
+        """Test repeats of an error differing only by location share one AI call."""
+        handler = ErrorHandlerAgent()
+        calls = []
+
+        async def fake_response(prompt, *args, **kwargs):
+            calls.append(prompt)
+            if len(calls) == 1:
+                raise RuntimeError("provider down")
+            return "Close the bracket."
+
+        handler.get_ai_response = fake_response
+        first = await handler.analyze_error("SyntaxError in /app/a.py line 3")
+        assert first.suggestion == "Review the error message and check related code."
+
+        second = await handler.analyze_error("SyntaxError in /app/a.py line 3")
+        third = await handler.analyze_error("SyntaxError in /app/b.py line 42")
+        assert second.suggestion == third.suggestion == "Close the bracket."
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fix_suggestions_share_one_ai_call(self):
+        """Test errors reported together are answered by one batched prompt."""
+        import asyncio
+
+        handler = ErrorHandlerAgent()
+        prompts = []
+
+        async def fake_response(prompt, *args, **kwargs):
+            prompts.append(prompt)
+            return "1. Close the string.\n2) Fix the\nJSON body.\n"
+
+        handler.get_ai_response = fake_response
+        results = await asyncio.gather(
+            handler._get_fix_suggestion("SyntaxError: unterminated string"),
+            handler._get_fix_suggestion("Invalid JSON body"),
+            handler._get_fix_suggestion("Parse error in template"),
+            handler._get_fix_suggestion("SyntaxError: unterminated string"),
+        )
+        assert len(prompts) == 1
+        assert "3. Parse error in template" in prompts[0]
+        assert results == [
+            "Close the string.",
+            "Fix the\nJSON body.",
+            "Review the error message and check related code.",
+            "Close the string.",
+        ]
+
+        # Answered errors are cached; the unanswered one is asked again
+        await handler._get_fix_suggestion("Invalid JSON body")
+        await handler._get_fix_suggestion("Parse error in template")
+        assert len(prompts) == 2
+        assert prompts[1].startswith("Analyze this error and suggest a fix:")
+
+    @pytest.mark.asyncio
+    async def test_fix_suggestion_batches_are_capped(self, monkeypatch):
+        """Test a full batch is sent at once and later errors start a new one."""
+        import asyncio
+
+        monkeypatch.setattr(ErrorHandlerAgent, "SUGGESTION_BATCH_SIZE", 2)
+        handler = ErrorHandlerAgent()
+        prompts = []
+
+        async def fake_response(prompt, *args, **kwargs):
+            prompts.append(prompt)
+            return "1. First fix\n2. Second fix"
+
+        handler.get_ai_response = fake_response
+        results = await asyncio.gather(
+            handler._get_fix_suggestion("Syntax error A"),
+            handler._get_fix_suggestion("Syntax error B"),
+            handler._get_fix_suggestion("Syntax error C"),
+        )
+        assert len(prompts) == 2
+        assert results == ["First fix", "Second fix", "1. First fix\n2. Second fix"]
+
+    @pytest.mark.asyncio
+    async def test_retries_counted_per_context(self):
+        """Test retries are tracked per context, whatever its key order."""
+        handler = ErrorHandlerAgent()
+        context = {"agent": "frontend", "task": "build"}
+        first = await handler.analyze_error("Request timeout", context)
+        second = await handler.analyze_error(
+            "Request timeout", {"task": "build", "agent": "frontend"}
+        )
+        assert (first.retry_count, second.retry_count) == (0, 1)
+
+        nested = {"agent": "frontend", "files": ["a.html"]}
+        await handler.analyze_error("Request timeout", nested)
+        again = await handler.analyze_error("Request timeout", nested)
+        assert again.retry_count == 1
+
+    @pytest.mark.asyncio
+    async def test_process_formats_busy_task_lazily(self):
+        """Test the busy description is passed as a format and argument."""
+        from unittest.mock import AsyncMock, patch
+
+        handler = ErrorHandlerAgent()
+        content = "timeout " * 20
+        message = Message(from_agent="tester", to_agent="handler", content=content)
+        with patch.object(handler, "_set_busy", new_callable=AsyncMock) as busy:
+            await handler.process(message)
+        assert busy.await_args_list[0].args == ("Analyzing error: %.50s", content)
+
+    @pytest.mark.asyncio
+    async def test_process_response_timestamp_is_utc(self):
+        """Test responses carry a timezone-aware UTC timestamp."""
+        from datetime import timezone
+
+        handler = ErrorHandlerAgent()
+        message = Message(from_agent="tester", to_agent="handler", content="timeout")
+        response = await handler.process(message)
+        assert response.timestamp.tzinfo is timezone.utc
+
     @pytest.mark.asyncio
     async def test_get_error_stats(self):
         """Test getting error statistics."""
@@ -75,6 +202,50 @@ class TestErrorHandlerAgent:
         stats = await handler.get_error_stats()
         assert stats["total_errors"] == 2
 
+    @pytest.mark.asyncio
+    async def test_error_stats_track_history(self):
+        """Test category and action counts follow the recorded history."""
+        handler = ErrorHandlerAgent()
+        await handler.analyze_error("Request timeout")
+        await handler.analyze_error("Connection refused")
+        await handler.analyze_error("Deadline exceeded")
+        stats = await handler.get_error_stats()
+        assert stats["by_category"] == {"timeout": 2, "network": 1}
+        assert stats["by_action"] == {"retry": 3}
+
+        handler.clear_history()
+        stats = await handler.get_error_stats()
+        assert stats["by_category"] == {}
+        assert stats["by_action"] == {}
+
+    @pytest.mark.asyncio
+    async def test_error_history_is_bounded(self, monkeypatch):
+        """Test old analyses are evicted and leave the stats exactly."""
+        monkeypatch.setattr(ErrorHandlerAgent, "ERROR_HISTORY_SIZE", 2)
+        handler = ErrorHandlerAgent()
+        await handler.analyze_error("Connection refused")
+        await handler.analyze_error("Request timeout")
+        await handler.analyze_error("Deadline exceeded")
+        history = await handler.get_error_history()
+        assert [a["category"] for a in history] == ["timeout", "timeout"]
+        stats = await handler.get_error_stats()
+        assert stats["total_errors"] == 2
+        assert stats["by_category"] == {"timeout": 2}
+        assert stats["by_action"] == {"retry": 2}
+
+    def test_error_analysis_is_slotted(self):
+        """Test ErrorAnalysis keeps its fields in slots with defaults."""
+        analysis = ErrorAnalysis("boom", ErrorCategory.RUNTIME, ErrorAction.RETRY)
+        assert not hasattr(analysis, "__dict__")
+        assert analysis.to_dict() == {
+            "error_message": "boom",
+            "category": "runtime",
+            "action": "retry",
+            "suggestion": None,
+            "retry_count": 0,
+            "max_retries": 3,
+        }
+
     def test_clear_history(self):
         """Test clearing error history."""
         handler = ErrorHandlerAgent()
@@ -172,6 +343,112 @@ class TestDesignerAgent:
         assert "background" in palette
         assert "text" in palette
 
+    @pytest.mark.asyncio
+    async def test_create_color_scheme_parses_ai_json(self):
+        """Test palette JSON is found in prose, nested or not."""
+        designer = DesignerAgent()
+        responses = iter(
+            [
+                'Sure! {not json} here:\n```json\n{"primary": "#111111"}\n```',
+                '{"colors": {"primary": "#222222", "note": "a {brace}"}}',
+            ]
+        )
+
+        async def fake_response(prompt, *args, **kwargs):
+            return next(responses)
+
+        designer.get_ai_response = fake_response
+        palette = await designer.create_color_scheme()
+        assert palette["primary"] == "#111111"
+        assert palette["secondary"] == "#8B5CF6"
+
+        palette = await designer.create_color_scheme(primary_color="green")
+        assert palette["primary"] == "#222222"
+        assert "colors" not in palette
+
+    def test_find_json_object_gives_up_on_brace_heavy_text(self):
+        """Test only a bounded number of "{" positions are decoded."""
+        from backend.agents import designer_agent
+
+        limit = designer_agent._JSON_MAX_STARTS
+        found = designer_agent._find_json_object(
+            "{" * (limit - 1) + '{"primary": "#111111"}'
+        )
+        assert found == {"primary": "#111111"}
+        assert designer_agent._find_json_object(
+            "{" * limit + '{"primary": "#111111"}'
+        ) is None
+        assert designer_agent._find_json_object('{"a":' * 5000) is None
+
+    @pytest.mark.asyncio
+    async def test_default_palette_not_shared(self):
+        """Test AI colors never leak into another designer's fallback."""
+        designer = DesignerAgent()
+
+        async def fake_response(prompt, *args, **kwargs):
+            return '{"primary": "#111111"}'
+
+        designer.get_ai_response = fake_response
+        await designer.create_color_scheme()
+
+        other = DesignerAgent()
+
+        async def failing_response(prompt, *args, **kwargs):
+            raise RuntimeError("provider down")
+
+        other.get_ai_response = failing_response
+        palette = await other.create_color_scheme()
+        assert palette["primary"] == "#3B82F6"
+
+    @pytest.mark.asyncio
+    async def test_color_scheme_reuses_ai_palette(self):
+        """Test a repeated palette request skips the AI call."""
+        designer = DesignerAgent()
+        calls = []
+
+        async def fake_response(prompt, *args, **kwargs):
+            calls.append(prompt)
+            if len(calls) == 1:
+                raise RuntimeError("provider down")
+            return '{"primary": "#111111"}'
+
+        designer.get_ai_response = fake_response
+        fallback = await designer.create_color_scheme()
+        assert fallback["primary"] == "#3B82F6"
+
+        first = await designer.create_color_scheme()
+        first["primary"] = "#ffffff"
+        second = await designer.create_color_scheme()
+        assert second["primary"] == "#111111"
+        assert len(calls) == 2
+
+        await designer.create_color_scheme(harmony="triadic")
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_palette_cache_is_bounded(self):
+        """Test the least recently used AI palette is evicted first."""
+        designer = DesignerAgent()
+        designer.PALETTE_CACHE_SIZE = 2
+        calls = []
+
+        async def fake_response(prompt, *args, **kwargs):
+            calls.append(prompt)
+            return '{"primary": "#111111"}'
+
+        designer.get_ai_response = fake_response
+        await designer.create_color_scheme(primary_color="red")
+        await designer.create_color_scheme(primary_color="green")
+        await designer.create_color_scheme(primary_color="red")
+        await designer.create_color_scheme(primary_color="blue")
+        assert len(designer._palette_cache) == 2
+        assert len(calls) == 3
+
+        await designer.create_color_scheme(primary_color="red")
+        assert len(calls) == 3
+        await designer.create_color_scheme(primary_color="green")
+        assert len(calls) == 4
+
     @pytest.mark.asyncio
     async def test_create_typography_system(self):
         """Test creating a typography system."""
@@ -181,6 +458,36 @@ class TestDesignerAgent:
         assert "sizes" in typography
         assert "line_heights" in typography
 
+    @pytest.mark.asyncio
+    async def test_typography_sizes_follow_scale(self):
+        """Test font sizes are derived from the base size and scale ratio."""
+        designer = DesignerAgent()
+        typography = await designer.create_typography_system(
+            base_size=16, scale="perfect-fifth"
+        )
+        assert typography["sizes"] == {
+            "xs": 7,
+            "sm": 11,
+            "base": 16,
+            "lg": 24,
+            "xl": 36,
+            "2xl": 54,
+            "3xl": 81,
+            "4xl": 122,
+        }
+        typography["sizes"]["base"] = 0
+        again = await designer.create_typography_system(
+            base_size=16, scale="perfect-fifth"
+        )
+        assert again["sizes"]["base"] == 16
+
+    def test_design_constants_are_read_only(self):
+        """Test the shared harmony and scale tables cannot be modified."""
+        with pytest.raises(TypeError):
+            DesignerAgent.TYPE_SCALES["custom"] = 2.0
+        with pytest.raises(TypeError):
+            DesignerAgent.COLOR_HARMONIES["custom"] = "anything"
+
     @pytest.mark.asyncio
     async def test_create_spacing_system(self):
         """Test creating a spacing system."""
@@ -190,6 +497,17 @@ class TestDesignerAgent:
         assert "2" in spacing
         assert "4" in spacing
 
+    @pytest.mark.asyncio
+    async def test_spacing_system_reused_but_independent(self):
+        """Test repeat spacing scales match without sharing one dict."""
+        designer = DesignerAgent()
+        first = await designer.create_spacing_system(base_unit=8)
+        first["1"] = 999
+        second = await designer.create_spacing_system(base_unit=8)
+        assert second["1"] == 8
+        assert second["64"] == 512
+        assert second is not first
+
     @pytest.mark.asyncio
     async def test_generate_css_variables(self):
         """Test generating CSS variables."""
@@ -200,6 +518,36 @@ class TestDesignerAgent:
         assert "--font-size-base" in css
         assert "--spacing-" in css
 
+    @pytest.mark.asyncio
+    async def test_css_variables_rerendered_after_token_change(self):
+        """Test cached CSS variables are rebuilt when tokens change."""
+        designer = DesignerAgent()
+        first = await designer.generate_css_variables()
+        assert await designer.generate_css_variables() is first
+        assert "--app-spacing-1: 4px;" in await designer.generate_css_variables(
+            prefix="app-"
+        )
+
+        await designer.create_spacing_system(base_unit=8)
+        css = await designer.generate_css_variables()
+        assert "--spacing-1: 8px;" in css
+        assert css.startswith(":root {\n  --color-primary:")
+        assert css.endswith("px;\n}")
+
+    @pytest.mark.asyncio
+    async def test_css_variables_follow_edits_to_returned_tokens(self):
+        """Test cached CSS variables pick up edits made to returned tokens."""
+        designer = DesignerAgent()
+        palette = await designer.create_color_scheme(primary_color="#3B82F6")
+        spacing = await designer.create_spacing_system(base_unit=4)
+        await designer.generate_css_variables()
+
+        palette["primary"] = "#000000"
+        spacing["1"] = 6
+        css = await designer.generate_css_variables()
+        assert "--color-primary: #000000;" in css
+        assert "--spacing-1: 6px;" in css
+
     @pytest.mark.asyncio
     async def test_generate_design_system(self):
         """Test generating complete design system."""
@@ -210,6 +558,56 @@ class TestDesignerAgent:
         assert "spacing" in system
         assert "breakpoints" in system
 
+    @pytest.mark.asyncio
+    async def test_generate_design_system_stays_busy(self):
+        """Test the agent reports one busy task until the system is done."""
+        designer = DesignerAgent()
+        seen = []
+
+        async def fake_response(prompt, *args, **kwargs):
+            seen.append((designer.status, designer.current_task))
+            return '{"primary": "#000000"}'
+
+        designer.get_ai_response = fake_response
+        system = await designer.generate_design_system()
+        assert seen == [(AgentState.BUSY, "Generating design system")]
+        assert system["colors"]["primary"] == "#000000"
+        assert "--color-primary: #000000;" in system["css_variables"]
+        assert designer.status == AgentState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_design_tokens_are_read_only_views(self):
+        """Test tokens and palettes are exposed as live read-only mappings."""
+        designer = DesignerAgent()
+        tokens = await designer.get_design_tokens()
+        palettes = await designer.get_color_palettes()
+        await designer.create_color_scheme("minimal", "red")
+        assert "colors" in tokens
+        assert "minimal_red" in palettes
+        with pytest.raises(TypeError):
+            tokens["colors"] = {}
+
+    @pytest.mark.asyncio
+    async def test_process_routes_by_keyword_priority(self):
+        """Test requests are routed to the first matching design task."""
+        designer = DesignerAgent()
+
+        async def fake_response(prompt, *args, **kwargs):
+            return "general advice"
+
+        designer.get_ai_response = fake_response
+
+        async def ask(content):
+            message = Message(from_agent="user", to_agent="designer", content=content)
+            return (await designer.process(message)).content
+
+        assert (await ask("Pick a FONT COLOR")).startswith("Color palette created")
+        assert (await ask("Font pairing")).startswith("Typography system")
+        assert (await ask("Spacing and CSS")).startswith("Spacing system")
+        assert (await ask("CSS variables")).startswith("CSS variables")
+        assert await ask("Make it pop") == "general advice"
+        assert designer.status == AgentState.IDLE
+
     def test_clear_tokens(self):
         """Test clearing design tokens."""
         designer = DesignerAgent()
@@ -309,6 +707,29 @@ class TestAccessibilityAgent:
         assert len(issues) > 0
         assert any(i.rule == "img-alt" for i in issues)
 
+    @pytest.mark.asyncio
+    async def test_audit_html_line_numbers(self):
+        """Test issues report the line the element appears on."""
+        a11y = AccessibilityAgent()
+        html = '<div>\n<p>Text</p>\n<img src="a.jpg">\n<img src="b.jpg">'
+        issues = await a11y.audit_html(html)
+        img_issues = [i for i in issues if i.rule == "img-alt"]
+        assert [i.line_number for i in img_issues] == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_audit_html_ignores_non_markup(self):
+        """Test tags inside comments and scripts are not audited."""
+        a11y = AccessibilityAgent()
+        html = (
+            '<!-- <img src="old.jpg"> -->\n'
+            '<script>\nconst tpl = \'<img src="x.jpg">\';\n</script>\n'
+            '<img src="real.jpg">'
+        )
+        issues = await a11y.audit_html(html)
+        img_issues = [i for i in issues if i.rule == "img-alt"]
+        assert len(img_issues) == 1
+        assert img_issues[0].line_number == 5
+
     @pytest.mark.asyncio
     async def test_audit_html_lang(self):
         """Test detecting missing lang attribute."""
@@ -326,6 +747,152 @@ class TestAccessibilityAgent:
         # Should have no img-alt issues
         assert not any(i.rule == "img-alt" for i in issues)
 
+    @pytest.mark.asyncio
+    async def test_audit_html_batch(self):
+        """Test auditing several documents in one batch."""
+        a11y = AccessibilityAgent()
+        htmls = [
+            '<img src="a.jpg">',
+            '<html lang="en"><img src="b.jpg" alt="B"></html>',
+            "<html><body>Content</body></html>",
+        ]
+        results = await a11y.audit_html_batch(htmls, max_concurrency=2)
+        assert len(results) == 3
+        assert any(i.rule == "img-alt" for i in results[0])
+        assert results[1] == []
+        assert any(i.rule == "html-lang" for i in results[2])
+        assert len(a11y._audit_history) == 1
+        assert a11y._audit_history[0]["documents"] == 3
+        assert a11y.status == AgentState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_audit_html_bytes(self):
+        """Test auditing UTF-8 bytes matches auditing the decoded text."""
+        a11y = AccessibilityAgent()
+        html = '<p>Café ☕</p>\n<img src="café.jpg">'
+        text_issues = await a11y.audit_html(html)
+        byte_issues = await a11y.audit_html(html.encode("utf-8"))
+        assert byte_issues == text_issues
+        assert text_issues[0].element == '<img src="café.jpg">'
+        assert text_issues[0].line_number == 2
+
+    @pytest.mark.asyncio
+    async def test_audit_html_reuses_cached_result(self, monkeypatch):
+        """Test repeat audits of identical HTML skip the checks."""
+        a11y = AccessibilityAgent()
+        html = '<img src="photo.jpg">'
+        first = await a11y.audit_html(html)
+
+        def fail(_html):
+            raise AssertionError("checks should not run for cached HTML")
+
+        monkeypatch.setattr(a11y, "_run_checks", fail)
+        second = await a11y.audit_html(html)
+        assert second == first
+        assert second is not first
+        assert len(a11y._issues) == 2
+
+        a11y.clear_issues()
+        assert len(a11y._audit_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_audit_html_skips_blank_input(self):
+        """Test blank documents are not audited or recorded."""
+        a11y = AccessibilityAgent()
+        assert await a11y.audit_html("") == []
+        assert await a11y.audit_html(b" \n\t ") == []
+        assert await a11y.audit_html_batch(["", "  "]) == [[], []]
+        assert len(a11y._audit_history) == 1
+        assert len(a11y._audit_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_audit_history_timestamps_are_utc(self):
+        """Test audit history timestamps carry a UTC offset."""
+        a11y = AccessibilityAgent()
+        await a11y.audit_html('<img src="a.jpg">')
+        await a11y.audit_html_batch(['<img src="a.jpg">', "<h1>A</h1>"])
+        for entry in a11y._audit_history:
+            assert entry["timestamp"].endswith("+00:00")
+
+    @pytest.mark.asyncio
+    async def test_audit_html_batch_processes(self):
+        """Test batch audits in a process pool match thread audits."""
+        from backend.agents import accessibility_agent
+
+        a11y = AccessibilityAgent()
+        htmls = ['<img src="a.jpg">', "<html><h1>A</h1><h4>B</h4></html>"]
+        try:
+            results = await a11y.audit_html_batch(htmls, use_processes=True)
+        finally:
+            accessibility_agent.shutdown_audit_pool()
+        assert results == [a11y._run_checks(html.encode()) for html in htmls]
+        assert accessibility_agent._audit_pool is None
+
+    @pytest.mark.asyncio
+    async def test_audit_pool_is_shared(self):
+        """Test agents share one audit pool and workers build no agent."""
+        from unittest.mock import patch
+
+        from backend.agents import accessibility_agent
+
+        first, second = AccessibilityAgent(), AccessibilityAgent()
+        html = '<img src="a.jpg">'
+        try:
+            await first.audit_html_batch([html], use_processes=True)
+            pool = accessibility_agent._audit_pool
+            await second.audit_html_batch(["<h1>A</h1>"], use_processes=True)
+            assert accessibility_agent._audit_pool is pool
+            assert pool._mp_context.get_start_method() == "spawn"
+        finally:
+            accessibility_agent.shutdown_audit_pool()
+
+        with patch.object(
+            AccessibilityAgent, "__init__", side_effect=AssertionError
+        ):
+            rows = accessibility_agent._audit_worker(html.encode())
+        assert [AccessibilityIssue(*row) for row in rows] == (
+            first._run_checks(html.encode())
+        )
+
+    @pytest.mark.asyncio
+    async def test_audit_html_batch_failure_clears_busy(self):
+        """Test a failed batch audit leaves the agent in error, not busy."""
+        from concurrent.futures.process import BrokenProcessPool
+        from unittest.mock import patch
+
+        a11y = AccessibilityAgent()
+        with patch.object(
+            a11y, "_audit_document", side_effect=BrokenProcessPool("died")
+        ):
+            with pytest.raises(BrokenProcessPool):
+                await a11y.audit_html_batch(["<h1>A</h1>"], use_processes=True)
+        assert a11y.status == AgentState.ERROR
+        assert not a11y._audit_history
+
+    @pytest.mark.asyncio
+    async def test_audit_html_form_labels(self):
+        """Test detecting inputs without a matching label."""
+        a11y = AccessibilityAgent()
+        html = (
+            '<label for="email">Email</label><input id="email">'
+            '<input id="phone"><input id="name" aria-label="Name">'
+        )
+        issues = await a11y.audit_html(html)
+        form_issues = [i for i in issues if i.rule == "form-label"]
+        assert len(form_issues) == 1
+        assert "phone" in form_issues[0].description
+
+    @pytest.mark.asyncio
+    async def test_audit_html_form_labels_any_order(self):
+        """Test labels are matched regardless of where they appear."""
+        a11y = AccessibilityAgent()
+        html = (
+            '<input id="email"><input id="zip" aria-labelledby="zip-help">\n'
+            "<label for='email'>Email</label>"
+        )
+        issues = await a11y.audit_html(html)
+        assert not any(i.rule == "form-label" for i in issues)
+
     @pytest.mark.asyncio
     async def test_check_color_contrast(self):
         """Test color contrast checking."""
@@ -341,6 +908,19 @@ class TestAccessibilityAgent:
         result = await a11y.check_color_contrast("#777777", "#888888")
         assert result["passes_aa_normal"] is False
 
+    @pytest.mark.asyncio
+    async def test_check_color_contrast_batch(self):
+        """Test checking several color pairs at once."""
+        a11y = AccessibilityAgent()
+        results = await a11y.check_color_contrast_batch([
+            ("#000000", "#FFFFFF"),
+            ("#777777", "#888888"),
+            ("#GGGGGG", "#FFFFFF"),
+        ])
+        assert results[0]["ratio"] == 21.0
+        assert results[1]["passes_aa_normal"] is False
+        assert "error" in results[2]
+
     @pytest.mark.asyncio
     async def test_add_aria_labels(self):
         """Test adding ARIA labels."""
@@ -349,6 +929,54 @@ class TestAccessibilityAgent:
         enhanced = await a11y.add_aria_labels(html)
         assert 'role="navigation"' in enhanced
 
+    @pytest.mark.asyncio
+    async def test_get_accessibility_report(self):
+        """Test report severity counts across audits."""
+        a11y = AccessibilityAgent()
+        await a11y.audit_html('<html><img src="a.jpg"></html>')
+        await a11y.audit_html("<h1>Title</h1><h3>Skipped</h3>")
+        report = await a11y.get_accessibility_report()
+        assert report["total_audits"] == 2
+        assert report["by_severity"] == {
+            "critical": 1,
+            "serious": 1,
+            "moderate": 1,
+            "minor": 0,
+        }
+
+        a11y.clear_issues()
+        report = await a11y.get_accessibility_report()
+        assert report["by_severity"]["critical"] == 0
+
+    @pytest.mark.asyncio
+    async def test_issue_severity(self):
+        """Test issues use severity enum values that serialize as strings."""
+        a11y = AccessibilityAgent()
+        issues = await a11y.audit_html('<img src="photo.jpg">')
+        assert issues[0].severity is AccessibilitySeverity.CRITICAL
+        assert issues[0].to_dict()["severity"] == "critical"
+        assert type(issues[0].to_dict()["severity"]) is str
+
+    def test_issue_with_plain_string_severity_serializes(self):
+        """Test severities outside the enum still serialize as given."""
+        assert AccessibilityIssue("r", "warning", "d").to_dict()["severity"] == (
+            "warning"
+        )
+        issue = AccessibilityIssue("r", "critical", "d")
+        assert issue.to_dict()["severity"] == "critical"
+
+    @pytest.mark.asyncio
+    async def test_issue_history_is_bounded(self):
+        """Test old issues are evicted and dropped from the counts."""
+        a11y = AccessibilityAgent(issue_history_size=3)
+        await a11y.audit_html("<h1>A</h1><h3>B</h3>")
+        await a11y.audit_html('<img src="a.jpg"><img src="b.jpg"><img src="c.jpg">')
+        report = await a11y.get_accessibility_report()
+        assert report["total_issues"] == 3
+        assert report["by_severity"]["moderate"] == 0
+        assert report["by_severity"]["critical"] == 3
+        assert len(report["issues"]) == 3
+
     def test_clear_issues(self):
         """Test clearing accessibility issues."""
         a11y = AccessibilityAgent()
@@ -387,11 +1015,10 @@ class TestAnalyticsAgent:
         assert "trackProductView" in code
         assert "trackAddToCart" in code
 
-    @pytest.mark.asyncio
-    async def test_generate_seo_tags(self):
+    def test_generate_seo_tags(self):
         """Test generating SEO meta tags."""
         analytics = AnalyticsAgent()
-        tags = await analytics.generate_seo_tags({
+        tags = analytics.generate_seo_tags({
             "title": "Test Page",
             "description": "Test description",
         })
@@ -400,20 +1027,35 @@ class TestAnalyticsAgent:
         assert "og:title" in tags
         assert "twitter:title" in tags
 
-    @pytest.mark.asyncio
-    async def test_generate_sitemap(self):
+    def test_generate_seo_tags_bytes(self):
+        """Test SEO tags can be generated as UTF-8 bytes."""
+        analytics = AnalyticsAgent()
+        page_info = {"title": "Café", "url": "https://example.com"}
+        tags = analytics.generate_seo_tags_bytes(page_info)
+        assert tags == analytics.generate_seo_tags(page_info).encode("utf-8")
+        assert "<title>Café</title>".encode() in tags
+
+    def test_generate_seo_tags_keywords(self):
+        """Test keywords are accepted as a string or any iterable."""
+        analytics = AnalyticsAgent()
+        expected = '<meta name="keywords" content="a, b">'
+        assert expected in analytics.generate_seo_tags({"keywords": "a, b"})
+        assert expected in analytics.generate_seo_tags({"keywords": ["a", "b"]})
+        assert expected in analytics.generate_seo_tags({"keywords": ("a", "b")})
+        assert "keywords" not in analytics.generate_seo_tags({"keywords": []})
+
+    def test_generate_sitemap(self):
         """Test generating XML sitemap."""
         analytics = AnalyticsAgent()
-        sitemap = await analytics.generate_sitemap("https://example.com")
+        sitemap = analytics.generate_sitemap("https://example.com")
         assert '<?xml version="1.0"' in sitemap
         assert "<urlset" in sitemap
         assert "<loc>https://example.com/</loc>" in sitemap
 
-    @pytest.mark.asyncio
-    async def test_generate_robots_txt(self):
+    def test_generate_robots_txt(self):
         """Test generating robots.txt."""
         analytics = AnalyticsAgent()
-        robots = await analytics.generate_robots_txt(
+        robots = analytics.generate_robots_txt(
             "https://example.com",
             disallow_paths=["/admin", "/private"]
         )
@@ -421,11 +1063,10 @@ class TestAnalyticsAgent:
         assert "Disallow: /admin" in robots
         assert "Sitemap: https://example.com/sitemap.xml" in robots
 
-    @pytest.mark.asyncio
-    async def test_generate_structured_data_organization(self):
+    def test_generate_structured_data_organization(self):
         """Test generating Organization structured data."""
         analytics = AnalyticsAgent()
-        data = await analytics.generate_structured_data("Organization", {
+        data = analytics.generate_structured_data("Organization", {
             "name": "Test Company",
             "url": "https://example.com",
         })
@@ -433,17 +1074,101 @@ class TestAnalyticsAgent:
         assert '"@type": "Organization"' in data
         assert "Test Company" in data
 
-    @pytest.mark.asyncio
-    async def test_generate_structured_data_product(self):
+    def test_generate_structured_data_product(self):
         """Test generating Product structured data."""
         analytics = AnalyticsAgent()
-        data = await analytics.generate_structured_data("Product", {
+        data = analytics.generate_structured_data("Product", {
             "name": "Test Product",
             "price": 29.99,
         })
         assert '"@type": "Product"' in data
         assert "Test Product" in data
 
+    def test_generate_structured_data_matches_pretty_json(self):
+        """Test templated structured data matches json.dumps(indent=2)."""
+        import json
+
+        analytics = AnalyticsAgent()
+        data = analytics.generate_structured_data("Article", {
+            "headline": 'Say "hi"',
+            "author": {"name": "Ada", "tags": ["a", "b"]},
+        })
+        body = data.split("\n", 1)[1].rsplit("\n", 1)[0]
+        expected = {
+            "@context": "https://schema.org",
+            "@type": "Article",
+            "headline": 'Say "hi"',
+            "description": "",
+            "image": "",
+            "author": {
+                "@type": "Person",
+                "name": {"name": "Ada", "tags": ["a", "b"]},
+            },
+            "datePublished": "",
+            "dateModified": "",
+        }
+        assert body == json.dumps(expected, indent=2)
+
+    @pytest.mark.asyncio
+    async def test_process_dispatch(self):
+        """Test process routes requests by their first matching keyword."""
+        analytics = AnalyticsAgent()
+
+        async def ask(content, metadata=None):
+            response = await analytics.process(Message(
+                from_agent="tester",
+                to_agent="AnalyticsAgent",
+                content=content,
+                metadata=metadata,
+            ))
+            return response.content
+
+        assert (await ask("Add tracking")).startswith("Analytics code generated")
+        assert (await ask("Write meta tags")).startswith("SEO tags generated")
+        assert (await ask("Build a sitemap")).startswith("Sitemap generated")
+        assert (await ask("SEO and analytics")).startswith(
+            "Analytics code generated"
+        )
+        # Keywords match anywhere in the text, including inside other words
+        # and overlapping ones, and priority beats position
+        assert (await ask("Update METADATA")).startswith("SEO tags generated")
+        assert (await ask("metanalytics")).startswith("Analytics code generated")
+        assert analytics.status == AgentState.IDLE
+
+    def test_generate_sitemap_lastmod_defaults_to_today(self):
+        """Test pages without lastmod use today's UTC date."""
+        from datetime import datetime, timezone
+
+        analytics = AnalyticsAgent()
+        sitemap = analytics.generate_sitemap("https://example.com", [
+            {"path": "/a"},
+            {"path": "/b", "lastmod": "2020-01-01"},
+        ])
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        assert f"<lastmod>{today}</lastmod>" in sitemap
+        assert "<lastmod>2020-01-01</lastmod>" in sitemap
+
+    @pytest.mark.asyncio
+    async def test_generated_scripts_are_reused(self):
+        """Test identical GA and robots.txt requests reuse the built text."""
+        analytics = AnalyticsAgent()
+        first = await analytics.generate_google_analytics("GA-1", True)
+        assert await analytics.generate_google_analytics("GA-1", True) is first
+        assert await analytics.generate_google_analytics("GA-1") is not first
+
+        robots = analytics.generate_robots_txt("https://a.com", ["/x"])
+        assert analytics.generate_robots_txt("https://a.com", ["/x"]) is robots
+
+    @pytest.mark.asyncio
+    async def test_get_generated_code_is_read_only_view(self):
+        """Test generated code is exposed as a live read-only mapping."""
+        analytics = AnalyticsAgent()
+        code = await analytics.get_generated_code()
+        analytics.generate_robots_txt("https://example.com")
+        assert "robots_txt" in code
+        with pytest.raises(TypeError):
+            code["robots_txt"] = ""
+
     def test_clear_generated(self):
         """Test clearing generated content."""
         analytics = AnalyticsAgent()